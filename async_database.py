@@ -0,0 +1,221 @@
+"""
+Async database module for concurrent scraping workers, using asyncpg.
+
+asyncpg implements the Postgres protocol natively (Cython) and pools
+connections, so inserts and queries from many concurrent city/date
+workers can be awaited in parallel instead of serializing on the single
+psycopg2 connection in database.py. The sync Database class remains the
+path for scripts and legacy callers.
+"""
+import os
+from datetime import date as date_type
+from typing import List, Dict, Optional, Tuple
+
+import asyncpg
+from dotenv import load_dotenv
+
+from database import _COLS, _ON_CONFLICT_SQL, _day_bounds, _vehicle_row
+
+# Load environment variables
+load_dotenv()
+
+# Same upsert clause as the sync module: with uq_vehicle_natural in
+# place, a re-scraped natural key refreshes prices instead of raising
+_INSERT_SQL = (
+    f"INSERT INTO vehicles ({', '.join(_COLS)}) "
+    "VALUES (" + ', '.join(f'${i}' for i in range(1, len(_COLS) + 1))
+    + ")" + _ON_CONFLICT_SQL + " RETURNING id"
+)
+
+
+class AsyncDatabase:
+    """Async vehicle-data access over an asyncpg connection pool."""
+
+    def __init__(self):
+        """
+        Read Supabase connection details; call connect() (or the create()
+        factory) before using the instance.
+        """
+        self.db_host = os.getenv('SUPABASE_DB_HOST')
+        self.db_port = os.getenv('SUPABASE_DB_PORT', '5432')
+        self.db_name = os.getenv('SUPABASE_DB_NAME')
+        self.db_user = os.getenv('SUPABASE_DB_USER')
+        self.db_password = os.getenv('SUPABASE_DB_PASSWORD')
+
+        if not all([self.db_host, self.db_name, self.db_user, self.db_password]):
+            raise ValueError(
+                "Missing Supabase database credentials. "
+                "Please set SUPABASE_DB_HOST, SUPABASE_DB_NAME, SUPABASE_DB_USER, and SUPABASE_DB_PASSWORD in .env"
+            )
+
+        self.pool = None
+
+    @classmethod
+    async def create(cls) -> 'AsyncDatabase':
+        """Construct and connect in one step."""
+        db = cls()
+        await db.connect()
+        return db
+
+    async def connect(self):
+        """Create the connection pool."""
+        try:
+            # Session timezone is set via server_settings at connect time,
+            # so no per-connection SET round-trip is needed
+            self.pool = await asyncpg.create_pool(
+                host=self.db_host,
+                port=int(self.db_port),
+                database=self.db_name,
+                user=self.db_user,
+                password=self.db_password,
+                min_size=2,
+                max_size=10,
+                timeout=10,
+                server_settings={'timezone': 'Australia/Sydney'}
+            )
+        except Exception as e:
+            raise ConnectionError(f"Failed to connect to Supabase database: {str(e)}")
+
+    async def insert_vehicle(self, vehicle_data: Dict) -> int:
+        """
+        Insert a vehicle record into the database.
+
+        Args:
+            vehicle_data: Dictionary containing vehicle information
+
+        Returns:
+            ID of the inserted record
+        """
+        row = _vehicle_row(vehicle_data)
+        try:
+            async with self.pool.acquire() as conn:
+                # asyncpg prepares and caches the statement per connection
+                return await conn.fetchval(_INSERT_SQL, *row)
+        except Exception as e:
+            raise Exception(f"Failed to insert vehicle: {str(e)}")
+
+    async def insert_vehicles_bulk(self, vehicles: List[Dict]) -> int:
+        """
+        Bulk-load vehicle records in a single binary COPY frame.
+        copy_records_to_table is the fastest bulk path in any Python
+        Postgres driver - no SQL parse per row and no per-row Python
+        overhead - so all rows for a pickup_date land in one operation.
+        COPY cannot apply the ON CONFLICT upsert, so a natural-key
+        duplicate (uq_vehicle_natural) raises; this path is for loads
+        known to be duplicate-free - use insert_vehicle to upsert.
+
+        Args:
+            vehicles: List of dictionaries containing vehicle information
+
+        Returns:
+            Number of rows copied
+        """
+        if not vehicles:
+            return 0
+
+        records = [_vehicle_row(v) for v in vehicles]
+        try:
+            async with self.pool.acquire() as conn:
+                await conn.copy_records_to_table(
+                    'vehicles', records=records, columns=_COLS, timeout=60
+                )
+            return len(records)
+        except Exception as e:
+            raise Exception(f"Failed to insert vehicles: {str(e)}")
+
+    async def replace_pickup_date(self, pickup_date: str, vehicles: List[Dict]) -> Tuple[int, int]:
+        """
+        Atomically replace all rows for a pickup date with fresh scrape data.
+        The DELETE and the COPY run in one transaction on one connection,
+        so readers never observe a half-replaced day and the whole swap
+        costs two server operations. The COPY cannot upsert, so the
+        replacement batch itself must be free of natural-key duplicates
+        (uq_vehicle_natural).
+
+        Args:
+            pickup_date: Pickup date (ISO format or YYYY-MM-DD)
+            vehicles: Replacement records for that date
+
+        Returns:
+            Tuple of (rows deleted, rows copied)
+        """
+        day = date_type.fromisoformat(pickup_date.split('T')[0])
+        # Half-open range keeps the delete sargable; pickup_date is a
+        # naive timestamp column
+        day_start, day_end = _day_bounds(day, tz_aware=False)
+        records = [_vehicle_row(v) for v in vehicles]
+        try:
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    result = await conn.execute(
+                        "DELETE FROM vehicles WHERE pickup_date >= $1 AND pickup_date < $2",
+                        day_start, day_end
+                    )
+                    if records:
+                        await conn.copy_records_to_table(
+                            'vehicles', records=records, columns=_COLS, timeout=60
+                        )
+            deleted_count = int(result.split()[-1])
+            return deleted_count, len(records)
+        except Exception as e:
+            raise Exception(f"Failed to replace vehicles for pickup_date: {str(e)}")
+
+    async def get_vehicles_by_date(self, date: str, city: Optional[str] = None) -> List[Dict]:
+        """
+        Get vehicles scraped on a specific date.
+
+        Args:
+            date: Scrape date (YYYY-MM-DD)
+            city: Optional city filter
+
+        Returns:
+            List of vehicle records
+        """
+        # Sargable range + explicit projection, mirroring the sync module
+        day_start, day_end = _day_bounds(date_type.fromisoformat(date))
+
+        async with self.pool.acquire() as conn:
+            if city:
+                rows = await conn.fetch("""
+                    SELECT id, scrape_datetime, city, pickup_date, return_date,
+                           vehicle_name, vehicle_type, price_per_day,
+                           total_price, currency, detail_url, screenshot_path
+                    FROM vehicles
+                    WHERE scrape_datetime >= $1 AND scrape_datetime < $2
+                    AND city = $3
+                    ORDER BY pickup_date, return_date
+                """, day_start, day_end, city)
+            else:
+                rows = await conn.fetch("""
+                    SELECT id, scrape_datetime, city, pickup_date, return_date,
+                           vehicle_name, vehicle_type, price_per_day,
+                           total_price, currency, detail_url, screenshot_path
+                    FROM vehicles
+                    WHERE scrape_datetime >= $1 AND scrape_datetime < $2
+                    ORDER BY city, pickup_date, return_date
+                """, day_start, day_end)
+            return [dict(row) for row in rows]
+
+    async def update_vehicle_screenshot(self, vehicle_id: int, screenshot_path: str):
+        """
+        Update a vehicle record with screenshot path.
+
+        Args:
+            vehicle_id: ID of the vehicle record
+            screenshot_path: Path to the screenshot file
+        """
+        try:
+            async with self.pool.acquire() as conn:
+                await conn.execute("""
+                    UPDATE vehicles
+                    SET screenshot_path = $1
+                    WHERE id = $2
+                """, screenshot_path, vehicle_id)
+        except Exception as e:
+            raise Exception(f"Failed to update vehicle screenshot: {str(e)}")
+
+    async def close(self):
+        """Close the connection pool."""
+        if self.pool:
+            await self.pool.close()
+            self.pool = None
@@ -2,9 +2,19 @@
 """
 Script to clear all screenshots from Cloudflare R2 storage.
 """
+import os
 import sys
 import logging
-from cloud_storage import CloudflareR2Storage
+from cloud_storage import get_default_r2
+
+# If screenshots live under a known prefix, the listing can be filtered
+# server-side instead of enumerating the whole bucket. The scraper uploads
+# keys at the bucket root, so the default is no prefix.
+SCREENSHOT_PREFIX = os.getenv('SCREENSHOT_PREFIX', '')
+
+# Extensions that count as screenshots. Checked via rpartition so only the
+# few-character extension is lowercased, not the whole key, per file.
+_IMG_EXTS = frozenset({'jpg', 'jpeg', 'png'})
 
 logging.basicConfig(
     level=logging.INFO,
@@ -19,37 +29,35 @@ logger = logging.getLogger(__name__)
 def clear_r2_screenshots():
     """Clear all screenshots from R2 storage."""
     try:
-        r2_storage = CloudflareR2Storage()
+        r2_storage = get_default_r2()
         
         try:
-            # List all files first to show what will be deleted
-            logger.info("Listing all files in R2 bucket...")
-            all_files = r2_storage.list_all_files()
-            
-            if not all_files:
+            # Stream the listing and delete in rolling 1000-key batches so
+            # deletion starts as soon as the first listing page arrives
+            logger.info(f"Listing screenshot files in R2 bucket (prefix: '{SCREENSHOT_PREFIX}')...")
+            total_files = 0
+            deleted_count = 0
+            batch = []
+            for file_path in r2_storage.iter_all_files(prefix=SCREENSHOT_PREFIX):
+                total_files += 1
+                # Filter out any non-image objects left under the prefix
+                if file_path.rpartition('.')[2].lower() in _IMG_EXTS:
+                    batch.append(file_path)
+                    # Buffer several 1000-key chunks so deletes run concurrently
+                    if len(batch) >= 10000:
+                        deleted_count += r2_storage.delete_files_batch(batch)
+                        batch = []
+            if batch:
+                deleted_count += r2_storage.delete_files_batch(batch)
+
+            if total_files == 0:
                 logger.info("No files found in R2 bucket.")
                 return
-            
-            logger.info(f"Found {len(all_files)} files in R2 bucket")
-            
-            # Filter for screenshot files (jpg, jpeg, png)
-            screenshot_files = [
-                f for f in all_files 
-                if f.lower().endswith(('.jpg', '.jpeg', '.png'))
-            ]
-            
-            if not screenshot_files:
+
+            if deleted_count == 0:
                 logger.info("No screenshot files found in R2 bucket.")
                 return
             
-            logger.info(f"Found {len(screenshot_files)} screenshot files to delete")
-            
-            # Delete all screenshot files
-            deleted_count = 0
-            for file_path in screenshot_files:
-                if r2_storage.delete_file(file_path):
-                    deleted_count += 1
-            
             logger.info("="*60)
             logger.info(f"Deleted {deleted_count} screenshot files from R2")
             logger.info("="*60)
@@ -63,14 +71,41 @@ def clear_r2_screenshots():
         sys.exit(1)
 
 
+def expire_r2_screenshots():
+    """Schedule screenshot deletion via a bucket lifecycle rule.
+
+    Costs a single API call regardless of bucket size; R2 removes the
+    objects server-side. Deletion is not immediate (objects expire after
+    one day), so use the default enumerate-and-delete path when the files
+    must be gone right away. Existing lifecycle rules on the bucket are
+    preserved; only the screenshot expiry rule is added or replaced.
+    """
+    try:
+        r2_storage = get_default_r2()
+        r2_storage.expire_prefix(SCREENSHOT_PREFIX, days=1)
+        logger.info("Lifecycle rule installed; R2 will expire the files server-side.")
+    except Exception as e:
+        logger.error(f"Failed to set lifecycle rule: {str(e)}", exc_info=True)
+        sys.exit(1)
+
+
 if __name__ == "__main__":
+    use_lifecycle = '--lifecycle' in sys.argv[1:]
+
     print("="*60)
-    print("WARNING: This will delete ALL screenshot files from R2 storage!")
+    if use_lifecycle:
+        print("WARNING: This will expire ALL screenshot files in R2 storage")
+        print("via a lifecycle rule (deleted server-side within ~1 day)!")
+    else:
+        print("WARNING: This will delete ALL screenshot files from R2 storage!")
     print("="*60)
     response = input("Are you sure you want to continue? (yes/no): ")
-    
+
     if response.lower() == 'yes':
-        clear_r2_screenshots()
+        if use_lifecycle:
+            expire_r2_screenshots()
+        else:
+            clear_r2_screenshots()
     else:
         print("Operation cancelled.")
         sys.exit(0)
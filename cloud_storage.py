@@ -1,9 +1,15 @@
 """
 Cloud storage module for uploading screenshots to Cloudflare R2.
 """
+import functools
 import os
+from collections import OrderedDict
+
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 from dotenv import load_dotenv
 import logging
@@ -28,6 +34,11 @@ class CloudflareR2Storage:
         self.bucket_name = os.getenv('CLOUDFLARE_R2_BUCKET_NAME')
         self.public_url = os.getenv('CLOUDFLARE_R2_PUBLIC_URL')  # Optional: public URL for accessing files
         
+        # Precompute the URL pieces used on every upload so the hot path
+        # avoids repeated strip/format work
+        self._public_url_base = (self.public_url or '').rstrip('/')
+        self._r2_url_prefix = f"r2://{self.bucket_name}/"
+
         if not all([self.account_id, self.access_key_id, self.secret_access_key, self.bucket_name]):
             raise ValueError(
                 "Missing Cloudflare R2 credentials. "
@@ -35,50 +46,151 @@ class CloudflareR2Storage:
                 "CLOUDFLARE_R2_SECRET_ACCESS_KEY, and CLOUDFLARE_R2_BUCKET_NAME in .env"
             )
         
+        # Tune the connection pool for concurrent uploads/deletes: the default
+        # pool of 10 serializes anything above 10 workers, and keep-alive
+        # avoids repeated TCP+TLS handshakes. Adaptive retries back off on
+        # R2 throttling.
+        client_config = Config(
+            max_pool_connections=int(os.getenv('R2_POOL_SIZE', '32')),
+            tcp_keepalive=True,
+            retries={'mode': 'adaptive', 'max_attempts': 5},
+            connect_timeout=5,
+            read_timeout=30
+        )
+
         # Initialize S3 client for R2 (R2 is S3-compatible)
         self.s3_client = boto3.client(
             's3',
             endpoint_url=f'https://{self.account_id}.r2.cloudflarestorage.com',
             aws_access_key_id=self.access_key_id,
             aws_secret_access_key=self.secret_access_key,
-            region_name='auto'  # R2 doesn't use regions
+            region_name='auto',  # R2 doesn't use regions
+            config=client_config
+        )
+
+        # get_paginator walks the service model each call; build the listing
+        # paginator once since it is reused for every clear/listing pass
+        self._list_paginator = self.s3_client.get_paginator('list_objects_v2')
+
+        # Screenshots are typically 50-500 KiB, well below boto3's default
+        # 8 MiB multipart threshold; raise the threshold and disable the
+        # managed transfer's worker threads so uploads are a plain PutObject
+        self._transfer_config = TransferConfig(
+            multipart_threshold=32 * 1024 * 1024,
+            use_threads=False,
+            max_concurrency=1
         )
+
+        # Opt-in WebP recompression for uploads (see upload_file); uploads
+        # are bandwidth-bound, so smaller bytes-on-the-wire cut latency
+        self._compress_webp = os.getenv('R2_COMPRESS_WEBP') == '1'
+
+        # Cache file_exists results so repeat checks for the same key are a
+        # dict lookup instead of a HeadObject round-trip. Entries are updated
+        # on upload/delete to stay correct within this process.
+        self._exists_cache = OrderedDict()
+        self._exists_cache_size = 4096
+
+        # Optional botocore-free async fast path (see raw_client)
+        self._raw_client = None
+
+    def raw_client(self):
+        """
+        Return an async R2RawClient sharing this instance's credentials.
+        The raw client signs SigV4 by hand and talks to R2 over aiohttp,
+        skipping botocore's per-call overhead; async callers opt in by
+        calling this method and using it for put/delete/list hot loops.
+        The boto3 client stays the default, compatible path.
+        """
+        if self._raw_client is None:
+            from r2_raw_client import R2RawClient
+            self._raw_client = R2RawClient(
+                self.account_id,
+                self.access_key_id,
+                self.secret_access_key,
+                self.bucket_name
+            )
+        return self._raw_client
     
-    def upload_file(self, local_file_path: str, remote_file_path: str, 
-                   content_type: str = 'image/jpeg') -> Optional[str]:
+    def upload_file(self, local_file_path: str, remote_file_path: str,
+                   content_type: str = 'image/jpeg', compress: bool = False) -> Optional[str]:
         """
         Upload a file to Cloudflare R2.
-        
+
         Args:
             local_file_path: Path to local file to upload
             remote_file_path: Path/name for file in R2 bucket
             content_type: MIME type of the file
-            
+            compress: Recompress the image to WebP before upload (also
+                enabled globally via R2_COMPRESS_WEBP=1). Cuts JPEG sizes
+                ~25-35% at quality 80; the stored key gets a .webp suffix
+
         Returns:
             Public URL of uploaded file if public_url is configured, otherwise None
         """
         try:
-            # Upload file to R2
-            self.s3_client.upload_file(
-                local_file_path,
-                self.bucket_name,
-                remote_file_path,
-                ExtraArgs={
-                    'ContentType': content_type
-                }
-            )
-            
-            logger.info(f"Uploaded {local_file_path} to R2 as {remote_file_path}")
+            # Normalize once up front; every branch below (object key, public
+            # URL, r2:// path) wants the slash-free form
+            remote_file_path = remote_file_path.lstrip('/')
+
+            if compress or self._compress_webp:
+                data, remote_file_path = self._encode_webp(local_file_path, remote_file_path)
+                content_type = 'image/webp'
+                self.s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=remote_file_path,
+                    Body=data,
+                    ContentType=content_type,
+                    ContentLength=len(data),
+                    ChecksumAlgorithm='CRC32'
+                )
+                logger.debug("Uploaded %s to R2 as %s (webp)", local_file_path, remote_file_path)
+                self._cache_exists(remote_file_path, True)
+                if self._public_url_base:
+                    return f"{self._public_url_base}/{remote_file_path}"
+                return self._r2_url_prefix + remote_file_path
+
+            size = os.path.getsize(local_file_path)
+            if size <= self._transfer_config.multipart_threshold:
+                # Screenshots fit in memory: read once and PutObject with an
+                # explicit length and CRC32 checksum. CRC32 is hardware
+                # accelerated and much cheaper than the default MD5, which
+                # boto3 computes with an extra pass over the file.
+                with open(local_file_path, 'rb') as f:
+                    data = f.read()
+                self.s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=remote_file_path,
+                    Body=data,
+                    ContentType=content_type,
+                    ContentLength=size,
+                    ChecksumAlgorithm='CRC32'
+                )
+            else:
+                # Fall back to the managed transfer for anything large enough
+                # to warrant multipart
+                self.s3_client.upload_file(
+                    local_file_path,
+                    self.bucket_name,
+                    remote_file_path,
+                    ExtraArgs={
+                        'ContentType': content_type
+                    },
+                    Config=self._transfer_config
+                )
+
+            # DEBUG with lazy %s formatting: per-item records are skipped
+            # entirely at the default INFO level during bulk runs
+            logger.debug("Uploaded %s to R2 as %s", local_file_path, remote_file_path)
+            self._cache_exists(remote_file_path, True)
             
             # Return public URL if configured, otherwise return R2 path for reference
-            if self.public_url:
-                # Remove leading slash from remote_file_path if present
-                remote_path = remote_file_path.lstrip('/')
-                return f"{self.public_url.rstrip('/')}/{remote_path}"
-            
+            if self._public_url_base:
+                return f"{self._public_url_base}/{remote_file_path}"
+
             # If no public URL, return the R2 path (user can construct URL themselves)
             # Format: r2://bucket-name/path or just the path
-            return f"r2://{self.bucket_name}/{remote_file_path.lstrip('/')}"
+            return self._r2_url_prefix + remote_file_path
         except ClientError as e:
             logger.error(f"Failed to upload {local_file_path} to R2: {str(e)}")
             raise Exception(f"R2 upload failed: {str(e)}")
@@ -86,6 +198,107 @@ class CloudflareR2Storage:
             logger.error(f"Unexpected error uploading to R2: {str(e)}")
             raise
     
+    def _encode_webp(self, local_file_path: str, remote_file_path: str) -> tuple:
+        """Re-encode an image as WebP in memory.
+
+        Returns (bytes, remote_path_with_webp_suffix). Pillow is imported
+        lazily so non-compressing callers skip the import.
+        """
+        import io
+        from PIL import Image
+
+        with Image.open(local_file_path) as img:
+            buf = io.BytesIO()
+            img.save(buf, format='WEBP', quality=80, method=4)
+        root, sep, _ = remote_file_path.rpartition('.')
+        remote_webp = (root if sep else remote_file_path) + '.webp'
+        return buf.getvalue(), remote_webp
+
+    def upload_many(self, uploads: list, content_type: str = 'image/jpeg') -> list:
+        """
+        Upload multiple files to Cloudflare R2 concurrently.
+        Bulk ingest is network-bound, so overlapping the PutObject round-trips
+        with a thread pool gives near-linear speedup over serial uploads.
+        Concurrency is tunable via the R2_UPLOAD_CONCURRENCY env var.
+
+        Args:
+            uploads: List of (local_file_path, remote_file_path) tuples
+            content_type: MIME type applied to all files
+
+        Returns:
+            List of (remote_file_path, url_or_none) tuples; url is None for
+            uploads that failed
+        """
+        if not uploads:
+            return []
+
+        def _upload_one(pair):
+            local_path, remote_path = pair
+            try:
+                return remote_path, self.upload_file(local_path, remote_path, content_type)
+            except Exception as e:
+                logger.error(f"Failed to upload {local_path}: {str(e)}")
+                return remote_path, None
+
+        max_workers = min(len(uploads), int(os.getenv('R2_UPLOAD_CONCURRENCY', '16')))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_upload_one, uploads))
+
+    def _delete_batch(self, chunk: list) -> int:
+        """Delete one chunk of up to 1000 keys via DeleteObjects. Returns success count."""
+        try:
+            response = self.s3_client.delete_objects(
+                Bucket=self.bucket_name,
+                Delete={
+                    'Objects': [{'Key': k} for k in chunk],
+                    'Quiet': True
+                }
+            )
+            # Quiet mode means the response carries only Errors, so failures
+            # stay observable per key without parsing a Deleted echo of every
+            # successful key
+            errors = response.get('Errors', [])
+            for err in errors:
+                logger.warning("Failed to delete %s: %s", err.get('Key'), err.get('Code'))
+            failed_keys = {err.get('Key') for err in errors}
+            for key in chunk:
+                if key not in failed_keys:
+                    self._cache_exists(key, False)
+            # One log record per batch, not per key - per-key logging dominates
+            # wall time on large clears
+            logger.debug("Deleted batch of %d keys", len(chunk) - len(errors))
+            return len(chunk) - len(errors)
+        except ClientError as e:
+            logger.error(f"Batch delete failed: {str(e)}")
+            return 0
+
+    def delete_files_batch(self, keys: list) -> int:
+        """
+        Delete multiple files from Cloudflare R2 using the batch DeleteObjects API.
+        Sends up to 1000 keys per request (the S3 API limit) instead of one
+        round-trip per key, and issues the batches concurrently so round-trips
+        overlap. Concurrency is tunable via the R2_DELETE_CONCURRENCY env var.
+
+        Args:
+            keys: List of file paths/keys in the R2 bucket
+
+        Returns:
+            Number of files successfully deleted
+        """
+        chunks = [keys[start:start + 1000] for start in range(0, len(keys), 1000)]
+
+        if len(chunks) <= 1:
+            return self._delete_batch(chunks[0]) if chunks else 0
+
+        # botocore clients are thread-safe, so batches can share s3_client
+        max_workers = min(len(chunks), int(os.getenv('R2_DELETE_CONCURRENCY', '16')))
+        deleted_count = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._delete_batch, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                deleted_count += future.result()
+        return deleted_count
+
     def delete_file(self, remote_file_path: str) -> bool:
         """
         Delete a file from Cloudflare R2.
@@ -97,16 +310,71 @@ class CloudflareR2Storage:
             True if successful, False otherwise
         """
         try:
-            self.s3_client.delete_object(
-                Bucket=self.bucket_name,
-                Key=remote_file_path
-            )
-            logger.info(f"Deleted {remote_file_path} from R2")
+            self._delete_object_raw(remote_file_path)
+            logger.debug("Deleted %s from R2", remote_file_path)
+            self._cache_exists(remote_file_path, False)
             return True
         except ClientError as e:
             logger.error(f"Failed to delete {remote_file_path} from R2: {str(e)}")
             return False
+
+    def _delete_object_raw(self, key: str):
+        """Issue a single DeleteObject with no logging or error handling.
+        For callers that manage their own reporting (batch paths)."""
+        self.s3_client.delete_object(
+            Bucket=self.bucket_name,
+            Key=key
+        )
     
+    def expire_prefix(self, prefix: str, days: int = 1):
+        """
+        Install a bucket lifecycle rule expiring all objects under a prefix.
+        One API call regardless of object count: R2 deletes the objects
+        server-side, asynchronously (typically within a day of the expiry),
+        so this is the cheapest way to clear a large prefix when immediate
+        deletion is not required.
+
+        put_bucket_lifecycle_configuration replaces the bucket's whole
+        lifecycle configuration, so the current rules are fetched first
+        and only the matching 'expire-...' rule is replaced; any other
+        pre-existing rules are preserved.
+
+        Args:
+            prefix: Key prefix whose objects should expire ('' for the whole bucket)
+            days: Days after creation at which objects expire (minimum 1)
+        """
+        rule_id = f'expire-{prefix or "all"}'
+        try:
+            # Merge with existing rules - the put call below overwrites
+            # the entire configuration, not just this rule
+            try:
+                current = self.s3_client.get_bucket_lifecycle_configuration(
+                    Bucket=self.bucket_name
+                )
+                rules = [r for r in current.get('Rules', []) if r.get('ID') != rule_id]
+            except ClientError as e:
+                if e.response.get('Error', {}).get('Code') != 'NoSuchLifecycleConfiguration':
+                    raise
+                rules = []
+
+            rules.append({
+                'ID': rule_id,
+                'Status': 'Enabled',
+                'Filter': {'Prefix': prefix},
+                'Expiration': {'Days': days}
+            })
+            self.s3_client.put_bucket_lifecycle_configuration(
+                Bucket=self.bucket_name,
+                LifecycleConfiguration={'Rules': rules}
+            )
+            logger.info(
+                "Lifecycle rule set: objects under prefix '%s' expire after %d day(s)",
+                prefix, days
+            )
+        except ClientError as e:
+            logger.error(f"Failed to set lifecycle rule for prefix '{prefix}': {str(e)}")
+            raise
+
     def file_exists(self, remote_file_path: str) -> bool:
         """
         Check if a file exists in Cloudflare R2.
@@ -117,41 +385,71 @@ class CloudflareR2Storage:
         Returns:
             True if file exists, False otherwise
         """
+        cached = self._exists_cache.get(remote_file_path)
+        if cached is not None:
+            self._exists_cache.move_to_end(remote_file_path)
+            return cached
+
         try:
             self.s3_client.head_object(
                 Bucket=self.bucket_name,
                 Key=remote_file_path
             )
-            return True
+            exists = True
         except ClientError as e:
-            if e.response['Error']['Code'] == '404':
-                return False
-            raise
+            if e.response['Error']['Code'] != '404':
+                raise
+            exists = False
+
+        self._cache_exists(remote_file_path, exists)
+        return exists
+
+    def _cache_exists(self, remote_file_path: str, exists: bool):
+        """Record a key's existence in the bounded LRU cache."""
+        self._exists_cache[remote_file_path] = exists
+        self._exists_cache.move_to_end(remote_file_path)
+        while len(self._exists_cache) > self._exists_cache_size:
+            self._exists_cache.popitem(last=False)
     
-    def list_all_files(self, prefix: str = '') -> list:
+    def iter_all_files(self, prefix: str = ''):
         """
-        List all files in the R2 bucket, optionally filtered by prefix.
-        
+        Iterate over all files in the R2 bucket, optionally filtered by prefix.
+        Yields keys as each ListObjectsV2 page arrives, so callers can start
+        processing (e.g. deleting) without waiting for the full listing.
+
         Args:
             prefix: Optional prefix to filter files (e.g., 'screenshots/')
-            
-        Returns:
-            List of file paths/keys
+
+        Yields:
+            File paths/keys
         """
         try:
-            files = []
-            paginator = self.s3_client.get_paginator('list_objects_v2')
-            pages = paginator.paginate(Bucket=self.bucket_name, Prefix=prefix)
-            
+            # Full 1000-key pages halve the ListObjectsV2 round-trips versus
+            # the smaller default page size
+            pages = self._list_paginator.paginate(
+                Bucket=self.bucket_name,
+                Prefix=prefix,
+                PaginationConfig={'PageSize': 1000}
+            )
+
             for page in pages:
-                if 'Contents' in page:
-                    for obj in page['Contents']:
-                        files.append(obj['Key'])
-            
-            return files
+                for obj in page.get('Contents', []):
+                    yield obj['Key']
         except ClientError as e:
             logger.error(f"Failed to list files from R2: {str(e)}")
             raise
+
+    def list_all_files(self, prefix: str = '') -> list:
+        """
+        List all files in the R2 bucket, optionally filtered by prefix.
+
+        Args:
+            prefix: Optional prefix to filter files (e.g., 'screenshots/')
+
+        Returns:
+            List of file paths/keys
+        """
+        return list(self.iter_all_files(prefix=prefix))
     
     def delete_all_files(self, prefix: str = '') -> int:
         """
@@ -164,20 +462,38 @@ class CloudflareR2Storage:
             Number of files deleted
         """
         try:
-            files = self.list_all_files(prefix=prefix)
-            
-            if not files:
+            # Stream keys from listing into 1000-key batches so deletion
+            # overlaps with listing instead of waiting for the full key list
+            deleted_count = 0
+            batch = []
+            for key in self.iter_all_files(prefix=prefix):
+                batch.append(key)
+                # Buffer several 1000-key chunks so delete_files_batch can
+                # issue them concurrently
+                if len(batch) >= 10000:
+                    deleted_count += self.delete_files_batch(batch)
+                    batch = []
+            if batch:
+                deleted_count += self.delete_files_batch(batch)
+
+            if deleted_count == 0:
                 logger.info(f"No files found with prefix '{prefix}'")
                 return 0
-            
-            deleted_count = 0
-            for file_path in files:
-                if self.delete_file(file_path):
-                    deleted_count += 1
-            
+
             logger.info(f"Deleted {deleted_count} files from R2 (prefix: '{prefix}')")
             return deleted_count
         except Exception as e:
             logger.error(f"Failed to delete all files from R2: {str(e)}")
             raise
 
+
+
+@functools.lru_cache(maxsize=1)
+def get_default_r2() -> CloudflareR2Storage:
+    """
+    Return a process-wide CloudflareR2Storage instance.
+    Constructing the boto3 client re-resolves credentials and rebuilds the
+    service model each time, so scripts and long-lived callers should share
+    this singleton (which also shares its connection pool and exists cache).
+    """
+    return CloudflareR2Storage()
@@ -1,19 +1,32 @@
 """
 Database module for storing scraped vehicle data using Supabase (PostgreSQL).
 """
+import csv
+import io
 import os
 import psycopg2
+import threading
+import weakref
+from contextlib import contextmanager
+from functools import lru_cache
 from psycopg2.extras import RealDictCursor
-from datetime import datetime
+from psycopg2.pool import ThreadedConnectionPool
+from datetime import datetime, time, timedelta
 from typing import List, Dict, Optional
 from dotenv import load_dotenv
-import pytz
+from zoneinfo import ZoneInfo
 
 # Load environment variables
 load_dotenv()
 
-# AEST timezone (handles both AEST UTC+10 and AEDT UTC+11 automatically)
-AEST = pytz.timezone('Australia/Sydney')
+# AEST timezone (handles both AEST UTC+10 and AEDT UTC+11 automatically).
+# stdlib zoneinfo is C-backed and cheaper than pytz, and datetimes carry
+# it directly via tzinfo= with no localize() step
+AEST = ZoneInfo('Australia/Sydney')
+
+# Bump whenever Database._SCHEMA_SQL changes so existing databases re-run
+# the migration batch on next startup
+_SCHEMA_VERSION = 8
 
 
 def get_aest_now():
@@ -21,6 +34,191 @@ def get_aest_now():
     return datetime.now(AEST)
 
 
+# Bound-method lookup hoisted out of the per-row hot path
+_fromisoformat = datetime.fromisoformat
+
+
+def _localize_aest(dt: datetime) -> datetime:
+    """Attach AEST to a naive datetime (zoneinfo needs no localize())."""
+    return dt.replace(tzinfo=AEST)
+
+try:
+    # C-extension ISO 8601 parser, much faster than fromisoformat and
+    # handles 'Z' natively; optional so the module works without it
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    def _parse_iso(dt_str: str) -> datetime:
+        try:
+            # Python 3.11+ fromisoformat handles 'Z' and most ISO variants
+            # directly; no string copy needed on the common path
+            return _fromisoformat(dt_str)
+        except ValueError:
+            return _fromisoformat(dt_str.replace('Z', '+00:00'))
+
+
+def _to_aest(value) -> datetime:
+    """
+    Coerce an ISO string or datetime object into an AEST-aware datetime.
+    Callers that already hold datetime objects skip parsing entirely;
+    psycopg2 adapts them natively anyway, so strings are just the
+    compatibility path.
+    """
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            return _localize_aest(value)
+        return value.astimezone(AEST)
+    return _coerce_aest(value)
+
+
+@lru_cache(maxsize=4096)
+def _coerce_aest(dt_str: str) -> datetime:
+    """
+    Parse an ISO datetime string into an AEST-aware datetime.
+
+    Memoized: within one scrape batch the pickup/return strings repeat
+    across every vehicle of a city/date combination, so the parse and tz
+    conversion run once per distinct string instead of once per row.
+    """
+    dt = _parse_iso(dt_str)
+    if dt.tzinfo is None:
+        dt = _localize_aest(dt)
+    elif dt.tzinfo != AEST:
+        dt = dt.astimezone(AEST)
+    return dt
+
+
+def _day_bounds(day, tz_aware: bool = True):
+    """
+    Return [start, end) datetimes covering one calendar day, for use in
+    sargable range predicates. `col >= start AND col < end` lets the
+    planner range-scan the B-tree index, whereas `DATE(col) = ...` wraps
+    the column in a function and forces a sequential scan.
+
+    Args:
+        day: datetime.date of the target day
+        tz_aware: localize bounds to AEST (for TIMESTAMPTZ columns);
+            False yields naive bounds (for TIMESTAMP columns)
+    """
+    start = datetime.combine(day, time.min)
+    if tz_aware:
+        start = _localize_aest(start)
+    return start, start + timedelta(days=1)
+
+
+def _vehicle_row(vehicle_data: Dict) -> tuple:
+    """
+    Normalize one vehicle dict into the 21-column insert tuple.
+    scrape_datetime stays AEST-aware; pickup/return dates represent AEST
+    times stored as naive TIMESTAMP, so the timezone is stripped after
+    conversion. Module-level so AsyncDatabase can share it.
+    """
+    scrape_dt_raw = vehicle_data.get('scrape_datetime')
+    scrape_dt = _to_aest(scrape_dt_raw) if scrape_dt_raw else get_aest_now()
+
+    pickup_dt_raw = vehicle_data.get('pickup_date')
+    if not pickup_dt_raw:
+        raise ValueError("pickup_date is required")
+    pickup_dt = _to_aest(pickup_dt_raw).replace(tzinfo=None)
+
+    return_dt_raw = vehicle_data.get('return_date')
+    if not return_dt_raw:
+        raise ValueError("return_date is required")
+    return_dt = _to_aest(return_dt_raw).replace(tzinfo=None)
+
+    return (
+        scrape_dt,
+        vehicle_data.get('city'),
+        pickup_dt,
+        return_dt,
+        vehicle_data.get('vehicle_name'),
+        vehicle_data.get('vehicle_type'),
+        vehicle_data.get('seats'),
+        vehicle_data.get('doors'),
+        vehicle_data.get('transmission'),
+        vehicle_data.get('excess'),
+        vehicle_data.get('fuel_type'),
+        vehicle_data.get('logo_url'),
+        vehicle_data.get('price_per_day'),
+        vehicle_data.get('total_price'),
+        vehicle_data.get('currency', 'AUD'),
+        vehicle_data.get('detail_url'),
+        vehicle_data.get('screenshot_path'),
+        vehicle_data.get('depot_code'),
+        vehicle_data.get('supplier_code'),
+        vehicle_data.get('city_latitude'),
+        vehicle_data.get('city_longitude')
+    )
+
+
+# Single source of truth for the vehicles column order; _vehicle_row and
+# every insert variant (prepared, UNNEST, COPY) derive from it so the
+# lists can never drift apart
+_COLS = (
+    'scrape_datetime', 'city', 'pickup_date', 'return_date',
+    'vehicle_name', 'vehicle_type',
+    'seats', 'doors', 'transmission', 'excess',
+    'fuel_type', 'logo_url',
+    'price_per_day', 'total_price', 'currency',
+    'detail_url', 'screenshot_path',
+    'depot_code', 'supplier_code',
+    'city_latitude', 'city_longitude'
+)
+
+# Array casts for the UNNEST insert, aligned with _COLS
+_COL_ARRAY_TYPES = (
+    'timestamptz[]', 'varchar[]', 'timestamp[]', 'timestamp[]',
+    'text[]', 'text[]',
+    'text[]', 'text[]', 'text[]', 'text[]',
+    'text[]', 'text[]',
+    'text[]', 'text[]', 'varchar[]',
+    'text[]', 'text[]',
+    'varchar[]', 'varchar[]',
+    'numeric[]', 'numeric[]'
+)
+
+_COL_LIST_SQL = ', '.join(_COLS)
+
+# Upsert clause shared by the insert variants: a re-scraped row refreshes
+# its prices and keeps the best-known screenshot instead of erroring (or
+# needing an upfront DELETE) against uq_vehicle_natural
+_ON_CONFLICT_SQL = (
+    " ON CONFLICT (scrape_datetime, city, pickup_date, return_date,"
+    " vehicle_name, depot_code)"
+    " DO UPDATE SET price_per_day = EXCLUDED.price_per_day,"
+    " total_price = EXCLUDED.total_price,"
+    " screenshot_path = COALESCE(EXCLUDED.screenshot_path,"
+    " vehicles.screenshot_path)"
+)
+
+# Row-tuple positions of the uq_vehicle_natural columns, for client-side
+# batch dedupe
+_NATURAL_KEY_IDX = tuple(_COLS.index(col) for col in (
+    'scrape_datetime', 'city', 'pickup_date', 'return_date',
+    'vehicle_name', 'depot_code'
+))
+
+
+def _dedupe_rows(rows):
+    """
+    Collapse rows that share a natural key, keeping the last occurrence.
+    ON CONFLICT DO UPDATE refuses to touch the same target row twice in
+    one statement, so a batch with an intra-batch duplicate (a results
+    page can legitimately list the same vehicle twice at one depot)
+    would otherwise fail wholesale.
+
+    Returns (deduped, keys): deduped maps each natural key to its
+    surviving row in first-seen order; keys holds one key per input row
+    so callers can map returned ids back onto every input row.
+    """
+    deduped = {}
+    keys = []
+    for row in rows:
+        key = tuple(row[i] for i in _NATURAL_KEY_IDX)
+        keys.append(key)
+        deduped[key] = row
+    return deduped, keys
+
+
 class Database:
     """Handles database operations for vehicle data using Supabase PostgreSQL."""
     
@@ -41,328 +239,475 @@ class Database:
                 "Please set SUPABASE_DB_HOST, SUPABASE_DB_NAME, SUPABASE_DB_USER, and SUPABASE_DB_PASSWORD in .env"
             )
         
-        self.conn = None
+        self.pool = None
+        # Pooled connections that already have the single-row insert
+        # PREPAREd. A WeakSet keys on the connection objects themselves:
+        # when the pool discards a broken connection, its entry vanishes
+        # with it, so a replacement allocated at a recycled address can
+        # never be mistaken for already-prepared (as an id()-keyed set
+        # would allow)
+        self._prepared_conns = weakref.WeakSet()
+        # Per-thread connection pinned by the transaction() context manager
+        self._local = threading.local()
         self._connect()
-        self._create_tables()
-    
+        # One cheap SELECT decides whether the migration batch runs at all;
+        # on an up-to-date database startup costs a single round-trip
+        if not self._schema_current():
+            self._create_tables()
+
     def _connect(self):
-        """Establish connection to PostgreSQL database."""
+        """Create the connection pool to the PostgreSQL database."""
         try:
-            self.conn = psycopg2.connect(
+            # A pool instead of one long-lived connection: worker threads
+            # query in parallel instead of serializing, and a dropped TCP
+            # session costs one pooled reconnect instead of stalling
+            # everything. Session timezone is set via connection options so
+            # TIMESTAMPTZ values display in AEST with no per-connection SET
+            # round-trip.
+            self.pool = ThreadedConnectionPool(
+                minconn=2,
+                maxconn=int(os.getenv('DB_POOL_SIZE', '10')),
                 host=self.db_host,
                 port=self.db_port,
                 database=self.db_name,
                 user=self.db_user,
                 password=self.db_password,
-                connect_timeout=10
+                connect_timeout=10,
+                options='-c timezone=Australia/Sydney -c statement_timeout=30000'
             )
-            self.conn.autocommit = False
-            
-            # Set session timezone to AEST so TIMESTAMPTZ values are displayed in AEST
-            cursor = self.conn.cursor()
-            cursor.execute("SET timezone = 'Australia/Sydney'")
-            cursor.close()
-            self.conn.commit()
         except Exception as e:
             raise ConnectionError(f"Failed to connect to Supabase database: {str(e)}")
-    
-    def _create_tables(self):
-        """Create necessary database tables if they don't exist."""
-        cursor = self.conn.cursor()
-        
+
+    @contextmanager
+    def _conn(self):
+        """
+        Borrow a connection from the pool and return it afterwards.
+        Connections run in autocommit mode: reads don't hold an implicit
+        transaction open (no idle-in-transaction, VACUUM can reclaim dead
+        tuples promptly) and single-statement writes self-commit without a
+        BEGIN/COMMIT round-trip pair.
+
+        Inside a transaction() block the thread's pinned connection is
+        reused instead, so every call in the block joins one transaction.
+        """
+        pinned = getattr(self._local, 'conn', None)
+        if pinned is not None:
+            yield pinned
+            return
+        conn = self.pool.getconn()
+        conn.autocommit = True
         try:
-            # Vehicles table
-            # scrape_datetime: TIMESTAMPTZ to preserve AEST timezone
-            # pickup_date and return_date: TIMESTAMP (without timezone) - these represent AEST times but stored without timezone conversion
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS vehicles (
-                    id SERIAL PRIMARY KEY,
-                    scrape_datetime TIMESTAMPTZ NOT NULL,
-                    city VARCHAR(255) NOT NULL,
-                    pickup_date TIMESTAMP NOT NULL,
-                    return_date TIMESTAMP NOT NULL,
-                    vehicle_name TEXT,
-                    vehicle_type TEXT,
-                    seats TEXT,
-                    doors TEXT,
-                    transmission TEXT,
-                    excess TEXT,
-                    fuel_type TEXT,
-                    logo_url TEXT,
-                    price_per_day TEXT,
-                    total_price TEXT,
-                    currency VARCHAR(10) DEFAULT 'AUD',
-                    detail_url TEXT,
-                    screenshot_path TEXT,
-                    depot_code VARCHAR(50),
-                    supplier_code VARCHAR(50),
-                    city_latitude NUMERIC(10, 8),
-                    city_longitude NUMERIC(11, 8)
-                )
-            """)
-            
-            # Drop created_at column if it exists (redundant - scrape_datetime serves the same purpose)
-            try:
-                cursor.execute("""
-                    SELECT column_name 
-                    FROM information_schema.columns 
-                    WHERE table_name='vehicles' AND column_name='created_at'
-                """)
-                if cursor.fetchone():
-                    cursor.execute("ALTER TABLE vehicles DROP COLUMN created_at")
-            except Exception as e:
-                # Ignore errors (column might not exist or other issues)
-                pass
-            
-            # Migrate scrape_datetime to TIMESTAMPTZ (if needed)
-            # pickup_date and return_date should remain as TIMESTAMP (without timezone)
+            yield conn
+        finally:
+            self.pool.putconn(conn)
+
+    @contextmanager
+    def _tx(self):
+        """
+        Borrow a connection wrapped in an explicit transaction, for the
+        multi-statement writes that must stay atomic (and for temp tables
+        / named cursors, which need a surrounding transaction). Inside a
+        transaction() block this is a no-op wrapper: the outer block owns
+        the commit.
+        """
+        pinned = getattr(self._local, 'conn', None)
+        if pinned is not None:
+            yield pinned
+            return
+        with self._conn() as conn:
+            conn.autocommit = False
             try:
-                cursor.execute("""
-                    SELECT data_type 
-                    FROM information_schema.columns 
-                    WHERE table_name='vehicles' AND column_name='scrape_datetime'
-                """)
-                result = cursor.fetchone()
-                if result and result[0] == 'timestamp without time zone':
-                    # Convert scrape_datetime to TIMESTAMPTZ
-                    # Treat existing timestamp as UTC (preserves the actual moment in time)
-                    cursor.execute("""
-                        ALTER TABLE vehicles 
-                        ALTER COLUMN scrape_datetime TYPE TIMESTAMPTZ 
-                        USING scrape_datetime AT TIME ZONE 'UTC'
-                    """)
-            except Exception as e:
-                # Ignore errors (column might not exist or already converted)
-                pass
-            
-            # Ensure pickup_date and return_date are TIMESTAMP (without timezone)
-            # If they're TIMESTAMPTZ, convert them to TIMESTAMP (extract the local time)
-            for column_name in ['pickup_date', 'return_date']:
-                try:
-                    cursor.execute("""
-                        SELECT data_type 
-                        FROM information_schema.columns 
-                        WHERE table_name='vehicles' AND column_name=%s
-                    """, (column_name,))
-                    result = cursor.fetchone()
-                    if result and result[0] == 'timestamp with time zone':
-                        # Convert TIMESTAMPTZ to TIMESTAMP (extract local time in AEST)
-                        cursor.execute(f"""
-                            ALTER TABLE vehicles 
-                            ALTER COLUMN {column_name} TYPE TIMESTAMP 
-                            USING {column_name} AT TIME ZONE 'Australia/Sydney'
-                        """)
-                except Exception as e:
-                    # Ignore errors (column might not exist or already correct)
-                    pass
-            
-            # Create indexes for faster queries
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_vehicles_scrape_datetime 
-                ON vehicles(scrape_datetime)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_vehicles_city 
-                ON vehicles(city)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_vehicles_pickup_date 
-                ON vehicles(pickup_date)
-            """)
-            # Add depot_code and supplier_code columns if they don't exist (migration for existing databases)
-            depot_code_columns = [
-                ('depot_code', 'VARCHAR(50)'),
-                ('supplier_code', 'VARCHAR(50)'),
-            ]
-            
-            for column_name, column_type in depot_code_columns:
-                try:
-                    # Check if column exists
-                    cursor.execute("""
-                        SELECT column_name 
-                        FROM information_schema.columns 
-                        WHERE table_name='vehicles' AND column_name=%s
-                    """, (column_name,))
-                    if not cursor.fetchone():
-                        # Column doesn't exist, add it
-                        cursor.execute(f"""
-                            ALTER TABLE vehicles 
-                            ADD COLUMN {column_name} {column_type}
-                        """)
-                except Exception as e:
-                    # Ignore errors (column might already exist or other issues)
-                    pass
-            
-            # Remove old depot info columns if they exist (cleanup migration)
-            old_depot_columns = [
-                'depot_name',
-                'depot_address',
-                'depot_city',
-                'depot_postcode',
-                'depot_phone',
-            ]
-            
-            for column_name in old_depot_columns:
-                try:
-                    # Check if column exists
-                    cursor.execute("""
-                        SELECT column_name 
-                        FROM information_schema.columns 
-                        WHERE table_name='vehicles' AND column_name=%s
-                    """, (column_name,))
-                    if cursor.fetchone():
-                        # Column exists, drop it
-                        cursor.execute(f"""
-                            ALTER TABLE vehicles 
-                            DROP COLUMN {column_name}
-                        """)
-                except Exception as e:
-                    # Ignore errors (column might not exist or other issues)
-                    pass
-            
-            # Drop screenshots table if it exists (no longer needed - screenshots stored in vehicles table)
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                conn.autocommit = True
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group every database call made in the block (by this thread) into
+        a single transaction with one commit - one WAL flush for a whole
+        city's writes instead of one per statement. Nesting is flat: an
+        inner transaction() joins the outer one.
+
+        Usage:
+            with db.transaction():
+                db.insert_vehicles_bulk(batch)
+                db.bulk_update_screenshot_paths(pairs)
+        """
+        if getattr(self._local, 'conn', None) is not None:
+            yield
+            return
+        conn = self.pool.getconn()
+        conn.autocommit = False
+        self._local.conn = conn
+        try:
+            yield
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._local.conn = None
+            conn.autocommit = True
+            self.pool.putconn(conn)
+
+    def _create_tables(self):
+        """Create necessary database tables if they don't exist."""
+        with self._tx() as conn:
+            self._create_tables_on(conn)
+
+    # Entire schema setup/migration as one idempotent batch, sent in a
+    # single round-trip and applied in one transaction:
+    # - scrape_datetime: TIMESTAMPTZ to preserve AEST timezone
+    # - pickup_date and return_date: TIMESTAMP (without timezone) - these
+    #   represent AEST times but stored without timezone conversion
+    # - the DO block handles the type conversions that need a data_type
+    #   check; everything else uses IF [NOT] EXISTS
+    # - the advisory lock serializes concurrent scraper startups so two
+    #   processes don't race on the same DDL
+    _SCHEMA_SQL = """
+        -- DDL is exempt from the connection-level 30s statement_timeout:
+        -- the type-conversion ALTERs rewrite the whole table and the
+        -- dedupe DELETE self-joins it, which on a populated database can
+        -- easily exceed the cap meant for normal statements. SET LOCAL
+        -- ends with this transaction, so the cap returns afterwards.
+        SET LOCAL statement_timeout = 0;
+
+        SELECT pg_advisory_xact_lock(hashtext('drivenow_vehicles_schema'));
+
+        CREATE TABLE IF NOT EXISTS vehicles (
+            id SERIAL PRIMARY KEY,
+            scrape_datetime TIMESTAMPTZ NOT NULL,
+            city VARCHAR(255) NOT NULL,
+            pickup_date TIMESTAMP NOT NULL,
+            return_date TIMESTAMP NOT NULL,
+            vehicle_name TEXT,
+            vehicle_type TEXT,
+            seats TEXT,
+            doors TEXT,
+            transmission TEXT,
+            excess TEXT,
+            fuel_type TEXT,
+            logo_url TEXT,
+            price_per_day TEXT,
+            total_price TEXT,
+            currency VARCHAR(10) DEFAULT 'AUD',
+            detail_url TEXT,
+            screenshot_path TEXT,
+            depot_code VARCHAR(50),
+            supplier_code VARCHAR(50),
+            city_latitude DOUBLE PRECISION,
+            city_longitude DOUBLE PRECISION
+        );
+
+        DO $$
+        BEGIN
+            -- scrape_datetime must be TIMESTAMPTZ; treat existing naive
+            -- values as UTC (preserves the actual moment in time)
+            IF (SELECT data_type FROM information_schema.columns
+                WHERE table_name = 'vehicles'
+                AND column_name = 'scrape_datetime') = 'timestamp without time zone' THEN
+                ALTER TABLE vehicles
+                    ALTER COLUMN scrape_datetime TYPE TIMESTAMPTZ
+                    USING scrape_datetime AT TIME ZONE 'UTC';
+            END IF;
+
+            -- pickup_date/return_date must be naive TIMESTAMP; extract the
+            -- local AEST time from any TIMESTAMPTZ values
+            IF (SELECT data_type FROM information_schema.columns
+                WHERE table_name = 'vehicles'
+                AND column_name = 'pickup_date') = 'timestamp with time zone' THEN
+                ALTER TABLE vehicles
+                    ALTER COLUMN pickup_date TYPE TIMESTAMP
+                    USING pickup_date AT TIME ZONE 'Australia/Sydney';
+            END IF;
+
+            IF (SELECT data_type FROM information_schema.columns
+                WHERE table_name = 'vehicles'
+                AND column_name = 'return_date') = 'timestamp with time zone' THEN
+                ALTER TABLE vehicles
+                    ALTER COLUMN return_date TYPE TIMESTAMP
+                    USING return_date AT TIME ZONE 'Australia/Sydney';
+            END IF;
+        END $$;
+
+        -- Column migrations for existing databases: add the current extra
+        -- columns, drop superseded ones (created_at duplicated
+        -- scrape_datetime; depot_* were replaced by depot_code)
+        ALTER TABLE vehicles
+            ADD COLUMN IF NOT EXISTS depot_code VARCHAR(50),
+            ADD COLUMN IF NOT EXISTS supplier_code VARCHAR(50),
+            ADD COLUMN IF NOT EXISTS city_latitude DOUBLE PRECISION,
+            ADD COLUMN IF NOT EXISTS city_longitude DOUBLE PRECISION,
+            DROP COLUMN IF EXISTS created_at,
+            DROP COLUMN IF EXISTS depot_name,
+            DROP COLUMN IF EXISTS depot_address,
+            DROP COLUMN IF EXISTS depot_city,
+            DROP COLUMN IF EXISTS depot_postcode,
+            DROP COLUMN IF EXISTS depot_phone;
+
+        -- Coordinates were NUMERIC(10,8)/(11,8); fixed-width DOUBLE
+        -- PRECISION is smaller on disk and far cheaper to compare. The
+        -- batch only runs on a version bump, so the rewrite is one-shot.
+        -- (The staging table is recreated below with the new types.)
+        ALTER TABLE vehicles
+            ALTER COLUMN city_latitude TYPE DOUBLE PRECISION
+                USING city_latitude::double precision,
+            ALTER COLUMN city_longitude TYPE DOUBLE PRECISION
+                USING city_longitude::double precision;
+        DROP TABLE IF EXISTS vehicles_stage;
+
+        -- Screenshots now live on the vehicles rows
+        DROP TABLE IF EXISTS screenshots CASCADE;
+
+        -- Version stamp consulted by _schema_current to skip this batch
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY
+        );
+
+        -- pickup_date is queried on its own by the upfront-delete and
+        -- replace paths, which the composite below (prefixed by
+        -- scrape_datetime) cannot serve
+        CREATE INDEX IF NOT EXISTS idx_vehicles_pickup_date
+            ON vehicles(pickup_date);
+
+        -- Natural-key upsert support: re-scraped rows land via ON
+        -- CONFLICT instead of an upfront DELETE. Pre-existing duplicates
+        -- are removed first (keeping the lowest id) so the unique index
+        -- build cannot fail on old data
+        DELETE FROM vehicles a
+        USING vehicles b
+        WHERE a.id > b.id
+          AND a.scrape_datetime = b.scrape_datetime
+          AND a.city = b.city
+          AND a.pickup_date = b.pickup_date
+          AND a.return_date = b.return_date
+          AND a.vehicle_name IS NOT DISTINCT FROM b.vehicle_name
+          AND a.depot_code IS NOT DISTINCT FROM b.depot_code;
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_vehicle_natural
+            ON vehicles(scrape_datetime, city, pickup_date, return_date,
+                        vehicle_name, depot_code);
+
+        -- The unique index's left prefix doubles as the day-range +
+        -- combination lookup index, and queries on scrape_datetime alone
+        -- use that prefix too - so the old single-column scrape_datetime
+        -- and city indexes (and the interim composite) are dropped,
+        -- leaving fewer btrees to maintain per insert
+        DROP INDEX IF EXISTS idx_vehicles_scrape_datetime;
+        DROP INDEX IF EXISTS idx_vehicles_city;
+        DROP INDEX IF EXISTS idx_vehicles_scrape_city;
+
+        -- Tiny partial index matching the screenshot-backfill predicate
+        -- verbatim, so that query reads only the unprocessed rows instead
+        -- of scanning the whole table (plain CREATE INDEX, not
+        -- CONCURRENTLY, because this batch runs inside a transaction)
+        CREATE INDEX IF NOT EXISTS idx_vehicles_no_screenshot
+            ON vehicles(scrape_datetime)
+            WHERE (screenshot_path IS NULL OR screenshot_path = '')
+            AND detail_url IS NOT NULL
+            AND detail_url != '';
+
+        -- Partial index for the summary aggregates: the has-screenshot
+        -- counts group by (scrape day, city) over only the rows that
+        -- carry a screenshot, so the daily coverage queries become an
+        -- index-only scan of the matching rows
+        CREATE INDEX IF NOT EXISTS idx_vehicles_screenshot
+            ON vehicles(scrape_datetime, city)
+            WHERE screenshot_path IS NOT NULL AND screenshot_path != '';
+
+        -- UNLOGGED staging table for the replace path: COPY lands the
+        -- batch here without WAL, then one INSERT ... SELECT moves it
+        -- into vehicles inside the replacing transaction
+        CREATE UNLOGGED TABLE IF NOT EXISTS vehicles_stage
+            (LIKE vehicles INCLUDING DEFAULTS);
+    """
+
+    def _schema_current(self) -> bool:
+        """Check whether the stored schema version matches the code's."""
+        with self._conn() as conn:
+            cursor = conn.cursor()
             try:
-                cursor.execute("""
-                    SELECT table_name 
-                    FROM information_schema.tables 
-                    WHERE table_name='screenshots'
-                """)
-                if cursor.fetchone():
-                    # Table exists, drop it
-                    cursor.execute("DROP TABLE screenshots CASCADE")
-            except Exception as e:
-                # Ignore errors (table might not exist or other issues)
-                pass
-            
-            # Add city location columns if they don't exist (migration for existing databases)
-            city_location_columns = [
-                ('city_latitude', 'NUMERIC(10, 8)'),
-                ('city_longitude', 'NUMERIC(11, 8)'),
-            ]
-            
-            for column_name, column_type in city_location_columns:
-                try:
-                    # Check if column exists
-                    cursor.execute("""
-                        SELECT column_name 
-                        FROM information_schema.columns 
-                        WHERE table_name='vehicles' AND column_name=%s
-                    """, (column_name,))
-                    if not cursor.fetchone():
-                        # Column doesn't exist, add it
-                        cursor.execute(f"""
-                            ALTER TABLE vehicles 
-                            ADD COLUMN {column_name} {column_type}
-                        """)
-                except Exception as e:
-                    # Ignore errors (column might already exist or other issues)
-                    pass
-            
-            self.conn.commit()
+                cursor.execute("SELECT version FROM schema_version LIMIT 1")
+                row = cursor.fetchone()
+                return row is not None and row[0] == _SCHEMA_VERSION
+            except Exception:
+                # Table missing (fresh database) or any other failure:
+                # fall through to the full migration batch
+                return False
+            finally:
+                cursor.close()
+
+    def _create_tables_on(self, conn):
+        cursor = conn.cursor()
+        try:
+            cursor.execute(self._SCHEMA_SQL)
+            cursor.execute("DELETE FROM schema_version")
+            cursor.execute("INSERT INTO schema_version (version) VALUES (%s)",
+                           (_SCHEMA_VERSION,))
         except Exception as e:
-            self.conn.rollback()
             raise Exception(f"Failed to create tables: {str(e)}")
         finally:
             cursor.close()
     
+    def _vehicle_row(self, vehicle_data: Dict) -> tuple:
+        """Normalize one vehicle dict into the 21-column insert tuple."""
+        return _vehicle_row(vehicle_data)
+
+    def insert_vehicles_bulk(self, vehicles: List[Dict]) -> List[int]:
+        """
+        Insert multiple vehicle records in a single round-trip.
+        Rows travel as per-column arrays through an UNNEST SELECT, so N
+        scraped vehicles cost one network round-trip and one constant-size
+        statement instead of N - the dominant saving on a remote Supabase
+        link. Natural-key duplicates within the batch are collapsed
+        last-wins first (the upsert cannot touch the same row twice in
+        one statement); every input row still receives an id.
+
+        Args:
+            vehicles: List of dictionaries containing vehicle information
+
+        Returns:
+            List of IDs of the inserted records, one per input row, in
+            input order
+        """
+        if not vehicles:
+            return []
+
+        rows = [self._vehicle_row(v) for v in vehicles]
+        deduped, keys = _dedupe_rows(rows)
+        # Transpose into per-column lists; psycopg2 adapts each list to a
+        # Postgres array, so the whole batch travels as 21 parameters.
+        # Lists, not tuples: psycopg2 renders tuples as record literals,
+        # which the ::type[] casts reject
+        columns = [list(col) for col in zip(*deduped.values())]
+        with self._conn() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(self._UNNEST_INSERT_SQL, columns)
+                # RETURNING yields one id per deduped row in array order;
+                # fan the ids back out so callers can zip(vehicles, ids)
+                # even when the batch carried duplicates
+                id_by_key = dict(zip(deduped,
+                                     (row[0] for row in cursor.fetchall())))
+                return [id_by_key[key] for key in keys]
+            except Exception as e:
+                raise Exception(f"Failed to insert vehicles: {str(e)}")
+            finally:
+                cursor.close()
+
+    # UNNEST keeps the statement text constant regardless of batch size
+    # (no quadratic VALUES growth, no 64k-parameter ceiling) and is among
+    # the fastest non-COPY insert paths; one statement, so autocommit
+    # makes the batch atomic without an explicit transaction
+    _UNNEST_INSERT_SQL = (
+        f"INSERT INTO vehicles ({_COL_LIST_SQL}) "
+        f"SELECT * FROM UNNEST("
+        + ', '.join(f'%s::{t}' for t in _COL_ARRAY_TYPES)
+        + f"){_ON_CONFLICT_SQL} RETURNING id"
+    )
+
+    _PREPARE_INSERT_SQL = (
+        f"PREPARE ins_vehicle AS INSERT INTO vehicles ({_COL_LIST_SQL}) "
+        "VALUES ("
+        + ', '.join(f'${i}' for i in range(1, len(_COLS) + 1))
+        + f"){_ON_CONFLICT_SQL} RETURNING id"
+    )
+
+    def _ensure_insert_prepared(self, conn):
+        """PREPARE the single-row insert once per pooled connection, so
+        repeated inserts skip the server-side parse/plan step."""
+        if conn in self._prepared_conns:
+            return
+        cursor = conn.cursor()
+        try:
+            cursor.execute(self._PREPARE_INSERT_SQL)
+            self._prepared_conns.add(conn)
+        finally:
+            cursor.close()
+
     def insert_vehicle(self, vehicle_data: Dict) -> int:
         """
         Insert a vehicle record into the database.
-        
+        Runs through a server-side prepared statement so the 21-column
+        INSERT is planned once per connection instead of per call.
+
         Args:
             vehicle_data: Dictionary containing vehicle information
-            
+
         Returns:
             ID of the inserted record
         """
-        cursor = self.conn.cursor()
-        
-        try:
-            # Parse datetime strings - ensure they're timezone-aware (AEST)
-            # scrape_datetime comes from get_aest_now() which is already AEST-aware
-            scrape_dt_str = vehicle_data.get('scrape_datetime')
-            if scrape_dt_str:
-                scrape_dt = datetime.fromisoformat(scrape_dt_str.replace('Z', '+00:00'))
-                # Ensure it's AEST-aware (if not already)
-                if scrape_dt.tzinfo is None:
-                    scrape_dt = AEST.localize(scrape_dt)
-                elif scrape_dt.tzinfo != AEST:
-                    scrape_dt = scrape_dt.astimezone(AEST)
-            else:
-                scrape_dt = get_aest_now()
-            
-            # pickup_date and return_date: Parse as AEST, then convert to naive datetime (no timezone)
-            # These represent AEST times but are stored as TIMESTAMP (without timezone) in the database
-            pickup_dt_str = vehicle_data.get('pickup_date')
-            if pickup_dt_str:
-                pickup_dt = datetime.fromisoformat(pickup_dt_str.replace('Z', '+00:00'))
-                # Convert to AEST if needed
-                if pickup_dt.tzinfo is None:
-                    pickup_dt = AEST.localize(pickup_dt)
-                elif pickup_dt.tzinfo != AEST:
-                    pickup_dt = pickup_dt.astimezone(AEST)
-                # Convert to naive datetime (remove timezone, keeping the AEST time values)
-                pickup_dt = pickup_dt.replace(tzinfo=None)
-            else:
-                raise ValueError("pickup_date is required")
-            
-            return_dt_str = vehicle_data.get('return_date')
-            if return_dt_str:
-                return_dt = datetime.fromisoformat(return_dt_str.replace('Z', '+00:00'))
-                # Convert to AEST if needed
-                if return_dt.tzinfo is None:
-                    return_dt = AEST.localize(return_dt)
-                elif return_dt.tzinfo != AEST:
-                    return_dt = return_dt.astimezone(AEST)
-                # Convert to naive datetime (remove timezone, keeping the AEST time values)
-                return_dt = return_dt.replace(tzinfo=None)
-            else:
-                raise ValueError("return_date is required")
-            
-            cursor.execute("""
-                INSERT INTO vehicles (
-                    scrape_datetime, city, pickup_date, return_date,
-                    vehicle_name, vehicle_type,
-                    seats, doors, transmission, excess,
-                    fuel_type, logo_url,
-                    price_per_day, total_price, currency,
-                    detail_url, screenshot_path,
-                    depot_code, supplier_code,
-                    city_latitude, city_longitude
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                RETURNING id
-            """, (
-                scrape_dt,
-                vehicle_data.get('city'),
-                pickup_dt,
-                return_dt,
-                vehicle_data.get('vehicle_name'),
-                vehicle_data.get('vehicle_type'),
-                vehicle_data.get('seats'),
-                vehicle_data.get('doors'),
-                vehicle_data.get('transmission'),
-                vehicle_data.get('excess'),
-                vehicle_data.get('fuel_type'),
-                vehicle_data.get('logo_url'),
-                vehicle_data.get('price_per_day'),
-                vehicle_data.get('total_price'),
-                vehicle_data.get('currency', 'AUD'),
-                vehicle_data.get('detail_url'),
-                vehicle_data.get('screenshot_path'),
-                vehicle_data.get('depot_code'),
-                vehicle_data.get('supplier_code'),
-                vehicle_data.get('city_latitude'),
-                vehicle_data.get('city_longitude')
-            ))
-            
-            vehicle_id = cursor.fetchone()[0]
-            self.conn.commit()
-            return vehicle_id
-        except Exception as e:
-            self.conn.rollback()
-            raise Exception(f"Failed to insert vehicle: {str(e)}")
-        finally:
-            cursor.close()
+        row = self._vehicle_row(vehicle_data)
+        with self._conn() as conn:
+            self._ensure_insert_prepared(conn)
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    "EXECUTE ins_vehicle (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, "
+                    "%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+                    row
+                )
+                # Single statement: autocommit has already persisted it
+                return cursor.fetchone()[0]
+            except Exception as e:
+                raise Exception(f"Failed to insert vehicle: {str(e)}")
+            finally:
+                cursor.close()
+
+    def copy_vehicles(self, vehicles: List[Dict]) -> int:
+        """
+        Bulk-load vehicle records via COPY, the fastest Postgres ingest path.
+        COPY streams all rows over one network frame with no per-row
+        parse/plan, which beats even multi-row INSERT by severalfold on
+        large re-scrapes. COPY has no RETURNING, so no ids come back;
+        downstream screenshot updates key on (city, pickup, return) and
+        don't need them. Use insert_vehicles_bulk when ids are required.
+        COPY cannot apply the ON CONFLICT upsert, so this path is for
+        loads known to be free of natural-key duplicates.
+
+        Args:
+            vehicles: List of dictionaries containing vehicle information
+
+        Returns:
+            Number of rows copied
+        """
+        if not vehicles:
+            return 0
+
+        # Build an in-memory CSV; csv.writer handles quoting/escaping of
+        # embedded commas, quotes and newlines in TEXT fields. None maps
+        # to an explicit \N marker so that genuine empty strings survive
+        # as '' instead of collapsing into NULL (the CSV default treats
+        # an unquoted empty field as NULL)
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for vehicle_data in vehicles:
+            writer.writerow([
+                '\\N' if value is None
+                else value.isoformat() if isinstance(value, datetime)
+                else value
+                for value in self._vehicle_row(vehicle_data)
+            ])
+        buf.seek(0)
+
+        with self._conn() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.copy_expert(
+                    f"COPY vehicles ({_COL_LIST_SQL}) "
+                    "FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                    buf)
+
+                # COPY is one statement; autocommit persists it
+                return cursor.rowcount
+            except Exception as e:
+                raise Exception(f"Failed to copy vehicles: {str(e)}")
+            finally:
+                cursor.close()
     
     def get_vehicles_by_date(self, date: str, city: Optional[str] = None) -> List[Dict]:
         """
@@ -375,50 +720,172 @@ class Database:
         Returns:
             List of vehicle records
         """
-        cursor = self.conn.cursor(cursor_factory=RealDictCursor)
-        
-        try:
-            if city:
+        day_start, day_end = _day_bounds(datetime.strptime(date, '%Y-%m-%d').date())
+
+        with self._conn() as conn:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            try:
+                # Explicit projection: readers of this method (summaries,
+                # reports) don't need the wide TEXT fields like logo_url or
+                # excess, and skipping them cuts the bytes shipped per row
+                if city:
+                    cursor.execute("""
+                        SELECT id, scrape_datetime, city, pickup_date, return_date,
+                               vehicle_name, vehicle_type, price_per_day,
+                               total_price, currency, detail_url, screenshot_path
+                        FROM vehicles
+                        WHERE scrape_datetime >= %s AND scrape_datetime < %s
+                        AND city = %s
+                        ORDER BY pickup_date, return_date
+                    """, (day_start, day_end, city))
+                else:
+                    cursor.execute("""
+                        SELECT id, scrape_datetime, city, pickup_date, return_date,
+                               vehicle_name, vehicle_type, price_per_day,
+                               total_price, currency, detail_url, screenshot_path
+                        FROM vehicles
+                        WHERE scrape_datetime >= %s AND scrape_datetime < %s
+                        ORDER BY city, pickup_date, return_date
+                    """, (day_start, day_end))
+
+                # RealDictRow is already dict-like; no per-row copy needed
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+    
+    def get_city_counts(self, date: str) -> List[tuple]:
+        """
+        Per-city vehicle counts for one scrape day in a single GROUP BY
+        query, replacing the fetch-everything-and-Counter pattern: the
+        server aggregates in one index scan and only (city, count) pairs
+        travel over the wire.
+
+        Args:
+            date: Scrape date (YYYY-MM-DD)
+
+        Returns:
+            List of (city, count) tuples ordered by city
+        """
+        day_start, day_end = _day_bounds(datetime.strptime(date, '%Y-%m-%d').date())
+
+        with self._conn() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("""
+                    SELECT city, COUNT(*)
+                    FROM vehicles
+                    WHERE scrape_datetime >= %s AND scrape_datetime < %s
+                    GROUP BY city
+                    ORDER BY city
+                """, (day_start, day_end))
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+
+    def get_screenshot_counts_by_city(self, date: str) -> List[tuple]:
+        """
+        Per-city counts of vehicles that have a screenshot for one scrape
+        day, aggregated server-side so the summary never materializes the
+        rows it is only going to count.
+
+        Args:
+            date: Scrape date (YYYY-MM-DD)
+
+        Returns:
+            List of (city, count) tuples ordered by city
+        """
+        day_start, day_end = _day_bounds(datetime.strptime(date, '%Y-%m-%d').date())
+
+        with self._conn() as conn:
+            cursor = conn.cursor()
+            try:
                 cursor.execute("""
-                    SELECT * FROM vehicles 
-                    WHERE DATE(scrape_datetime) = %s AND city = %s
-                    ORDER BY pickup_date, return_date
-                """, (date, city))
-            else:
+                    SELECT city, COUNT(*)
+                    FROM vehicles
+                    WHERE scrape_datetime >= %s AND scrape_datetime < %s
+                    AND screenshot_path IS NOT NULL AND screenshot_path != ''
+                    GROUP BY city
+                    ORDER BY city
+                """, (day_start, day_end))
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+
+    def get_daily_summary(self, date: str) -> List[Dict]:
+        """
+        Whole end-of-run summary for one scrape day in a single aggregate
+        query: per-city totals plus URL and screenshot coverage, computed
+        in one pass server-side. Replaces fetching every row and scanning
+        the list three times in Python.
+
+        Args:
+            date: Scrape date (YYYY-MM-DD)
+
+        Returns:
+            List of dicts with city, total, with_urls, with_screenshots,
+            ordered by city
+        """
+        day_start, day_end = _day_bounds(datetime.strptime(date, '%Y-%m-%d').date())
+
+        with self._conn() as conn:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            try:
                 cursor.execute("""
-                    SELECT * FROM vehicles 
-                    WHERE DATE(scrape_datetime) = %s
-                    ORDER BY city, pickup_date, return_date
-                """, (date,))
-            
-            results = cursor.fetchall()
-            # Convert RealDictRow to regular dict
-            return [dict(row) for row in results]
-        finally:
-            cursor.close()
-    
+                    SELECT city,
+                           COUNT(*) AS total,
+                           COUNT(*) FILTER (WHERE detail_url IS NOT NULL
+                                            AND detail_url != '') AS with_urls,
+                           COUNT(*) FILTER (WHERE screenshot_path IS NOT NULL
+                                            AND screenshot_path != '') AS with_screenshots
+                    FROM vehicles
+                    WHERE scrape_datetime >= %s AND scrape_datetime < %s
+                    GROUP BY city
+                    ORDER BY city
+                """, (day_start, day_end))
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+
+    def iter_vehicles_without_screenshots(self, itersize: int = 1000):
+        """
+        Stream vehicles that don't have screenshots yet.
+        Uses a named server-side cursor so rows arrive in itersize chunks
+        instead of the whole result set being buffered client-side -
+        peak memory stays flat however large the backfill is, and the
+        first rows are available before the query finishes.
+
+        Yields:
+            Vehicle records with detail_url
+        """
+        # Named cursors need a surrounding transaction
+        with self._tx() as conn:
+            cursor = conn.cursor(name='vehicles_no_ss', cursor_factory=RealDictCursor)
+            cursor.itersize = itersize
+            try:
+                # The backfill only needs the identity/URL columns, not all
+                # 21 including the wide TEXT fields
+                cursor.execute("""
+                    SELECT id, detail_url, city, pickup_date, return_date,
+                           scrape_datetime
+                    FROM vehicles
+                    WHERE (screenshot_path IS NULL OR screenshot_path = '')
+                    AND detail_url IS NOT NULL
+                    AND detail_url != ''
+                    ORDER BY scrape_datetime, city, pickup_date
+                """)
+                # RealDictRow is already dict-like; yield rows as-is
+                yield from cursor
+            finally:
+                cursor.close()
+
     def get_vehicles_without_screenshots(self) -> List[Dict]:
         """
         Get all vehicles that don't have screenshots yet.
-        
+
         Returns:
             List of vehicle records with detail_url
         """
-        cursor = self.conn.cursor(cursor_factory=RealDictCursor)
-        
-        try:
-            cursor.execute("""
-                SELECT * FROM vehicles 
-                WHERE (screenshot_path IS NULL OR screenshot_path = '')
-                AND detail_url IS NOT NULL
-                AND detail_url != ''
-                ORDER BY scrape_datetime, city, pickup_date
-            """)
-            
-            results = cursor.fetchall()
-            return [dict(row) for row in results]
-        finally:
-            cursor.close()
+        return list(self.iter_vehicles_without_screenshots())
     
     def update_vehicle_screenshot(self, vehicle_id: int, screenshot_path: str):
         """
@@ -428,20 +895,52 @@ class Database:
             vehicle_id: ID of the vehicle record
             screenshot_path: Path to the screenshot file
         """
-        cursor = self.conn.cursor()
-        try:
-            cursor.execute("""
-                UPDATE vehicles 
-                SET screenshot_path = %s 
-                WHERE id = %s
-            """, (screenshot_path, vehicle_id))
-            self.conn.commit()
-        except Exception as e:
-            self.conn.rollback()
-            raise Exception(f"Failed to update vehicle screenshot: {str(e)}")
-        finally:
-            cursor.close()
+        with self._conn() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("""
+                    UPDATE vehicles
+                    SET screenshot_path = %s
+                    WHERE id = %s
+                """, (screenshot_path, vehicle_id))
+            except Exception as e:
+                raise Exception(f"Failed to update vehicle screenshot: {str(e)}")
+            finally:
+                cursor.close()
     
+    def bulk_update_screenshot_paths(self, updates: List[tuple]) -> int:
+        """
+        Attach screenshot paths to many vehicles at once.
+        The (id, path) pairs travel as two parallel arrays into a single
+        UPDATE ... FROM UNNEST join on the primary key, so a scrape's
+        worth of screenshot attachments costs one round-trip and one WAL
+        flush instead of one UPDATE per vehicle.
+
+        Args:
+            updates: List of (vehicle_id, screenshot_path) tuples
+
+        Returns:
+            Number of records updated
+        """
+        if not updates:
+            return 0
+
+        ids, paths = zip(*updates)
+        with self._conn() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("""
+                    UPDATE vehicles v
+                    SET screenshot_path = t.path
+                    FROM UNNEST(%s::int[], %s::text[]) AS t(id, path)
+                    WHERE v.id = t.id
+                """, (list(ids), list(paths)))
+                return cursor.rowcount
+            except Exception as e:
+                raise Exception(f"Failed to bulk update screenshot paths: {str(e)}")
+            finally:
+                cursor.close()
+
     def update_screenshot_path_for_combination(self, scrape_datetime: str, city: str,
                                                pickup_date: str, return_date: str,
                                                old_path: str, new_path: str):
@@ -460,30 +959,29 @@ class Database:
         Returns:
             Number of records updated
         """
-        cursor = self.conn.cursor()
-        try:
-            # Parse datetime strings to TIMESTAMP
-            scrape_dt = datetime.fromisoformat(scrape_datetime.replace('Z', '+00:00'))
-            pickup_dt = datetime.fromisoformat(pickup_date.replace('Z', '+00:00'))
-            return_dt = datetime.fromisoformat(return_date.replace('Z', '+00:00'))
-            
-            cursor.execute("""
-                UPDATE vehicles 
-                SET screenshot_path = %s 
-                WHERE DATE(scrape_datetime) = DATE(%s)
-                AND city = %s 
-                AND pickup_date = %s 
-                AND return_date = %s
-                AND screenshot_path = %s
-            """, (new_path, scrape_dt, city, pickup_dt, return_dt, old_path))
-            updated_count = cursor.rowcount
-            self.conn.commit()
-            return updated_count
-        except Exception as e:
-            self.conn.rollback()
-            raise Exception(f"Failed to update screenshot paths: {str(e)}")
-        finally:
-            cursor.close()
+        # Parse datetime strings to TIMESTAMP
+        scrape_dt = _parse_iso(scrape_datetime)
+        pickup_dt = _parse_iso(pickup_date)
+        return_dt = _parse_iso(return_date)
+        day_start, day_end = _day_bounds(scrape_dt.date())
+
+        with self._conn() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("""
+                    UPDATE vehicles
+                    SET screenshot_path = %s
+                    WHERE scrape_datetime >= %s AND scrape_datetime < %s
+                    AND city = %s
+                    AND pickup_date = %s
+                    AND return_date = %s
+                    AND screenshot_path = %s
+                """, (new_path, day_start, day_end, city, pickup_dt, return_dt, old_path))
+                return cursor.rowcount
+            except Exception as e:
+                raise Exception(f"Failed to update screenshot paths: {str(e)}")
+            finally:
+                cursor.close()
     
     def delete_vehicles_for_pickup_date(self, pickup_date: str, cloud_storage=None):
         """
@@ -498,71 +996,192 @@ class Database:
         Returns:
             Tuple of (number of records deleted, number of screenshots deleted from R2)
         """
-        cursor = self.conn.cursor()
         screenshots_deleted = 0
-        
+
+        # Parse pickup_date - handle both datetime and date-only formats
         try:
-            # Parse pickup_date - handle both datetime and date-only formats
+            pickup_dt = _parse_iso(pickup_date)
+        except:
+            # If parsing fails, try date-only format
+            pickup_dt = datetime.strptime(pickup_date.split('T')[0], '%Y-%m-%d')
+
+        # pickup_date is a naive TIMESTAMP column, so the range bounds stay naive
+        day_start, day_end = _day_bounds(pickup_dt.date(), tz_aware=False)
+
+        with self._conn() as conn:
+            cursor = conn.cursor()
             try:
-                pickup_dt = datetime.fromisoformat(pickup_date.replace('Z', '+00:00'))
-            except:
-                # If parsing fails, try date-only format
-                pickup_dt = datetime.strptime(pickup_date.split('T')[0], '%Y-%m-%d')
-            
-            # First, get all unique screenshot paths for this pickup_date before deleting
-            screenshot_paths_to_delete = set()
-            if cloud_storage:
+                # Delete the rows and harvest the distinct screenshot paths
+                # in the same statement: one indexed heap pass and one
+                # round-trip instead of a SELECT followed by a DELETE over
+                # the same rows
                 cursor.execute("""
-                    SELECT DISTINCT screenshot_path 
-                    FROM vehicles 
-                    WHERE DATE(pickup_date) = DATE(%s)
-                    AND screenshot_path IS NOT NULL
-                    AND screenshot_path != ''
-                """, (pickup_dt,))
-                screenshot_paths = cursor.fetchall()
-                screenshot_paths_to_delete = {row[0] for row in screenshot_paths if row[0]}
-            
-            # Delete screenshots from R2 if cloud storage is enabled
-            if cloud_storage and screenshot_paths_to_delete:
-                from urllib.parse import urlparse
-                import os
-                
-                for screenshot_path in screenshot_paths_to_delete:
-                    try:
-                        # Extract R2 file path from URL or use path directly
-                        if screenshot_path.startswith('http'):
-                            # Extract path from URL (e.g., https://public-url.com/screenshots/file.jpg -> screenshots/file.jpg)
-                            parsed_url = urlparse(screenshot_path)
-                            # Remove leading slash
-                            r2_path = parsed_url.path.lstrip('/')
-                        else:
-                            # Local path - use as is (relative to bucket root)
-                            r2_path = screenshot_path.lstrip('/')
-                        
-                        # Delete from R2
-                        if cloud_storage.delete_file(r2_path):
-                            screenshots_deleted += 1
-                    except Exception as e:
-                        # Log error but continue - don't fail the whole operation
-                        import logging
-                        logger = logging.getLogger(__name__)
-                        logger.warning(f"Failed to delete screenshot from R2: {screenshot_path} - {str(e)}")
-            
-            # Delete all records for this pickup_date (date part only, ignoring time)
-            cursor.execute("""
-                DELETE FROM vehicles 
-                WHERE DATE(pickup_date) = DATE(%s)
-            """, (pickup_dt,))
-            deleted_count = cursor.rowcount
-            self.conn.commit()
-            return deleted_count, screenshots_deleted
-        except Exception as e:
-            self.conn.rollback()
-            raise Exception(f"Failed to delete vehicles for pickup_date: {str(e)}")
-        finally:
-            cursor.close()
-    
-    def delete_vehicles_for_combination(self, scrape_datetime: str, city: str, 
+                    WITH del AS (
+                        DELETE FROM vehicles
+                        WHERE pickup_date >= %s AND pickup_date < %s
+                        RETURNING screenshot_path
+                    )
+                    SELECT COUNT(*),
+                           ARRAY_AGG(DISTINCT screenshot_path)
+                               FILTER (WHERE screenshot_path IS NOT NULL
+                                       AND screenshot_path != '')
+                    FROM del
+                """, (day_start, day_end))
+                deleted_count, screenshot_paths_to_delete = cursor.fetchone()
+            except Exception as e:
+                raise Exception(f"Failed to delete vehicles for pickup_date: {str(e)}")
+            finally:
+                cursor.close()
+
+        # Screenshot keys go to R2 in one batch call (up to 1000 per
+        # DeleteObjects request) instead of one HTTPS round-trip each
+        if cloud_storage and screenshot_paths_to_delete:
+            from urllib.parse import urlparse
+
+            r2_keys = []
+            for screenshot_path in screenshot_paths_to_delete:
+                # Extract R2 file path from URL or use path directly
+                if screenshot_path.startswith('http'):
+                    # e.g. https://public-url.com/screenshots/file.jpg -> screenshots/file.jpg
+                    r2_keys.append(urlparse(screenshot_path).path.lstrip('/'))
+                else:
+                    # Local path - use as is (relative to bucket root)
+                    r2_keys.append(screenshot_path.lstrip('/'))
+
+            try:
+                screenshots_deleted = cloud_storage.delete_files_batch(r2_keys)
+            except Exception as e:
+                # Log error but continue - don't fail the whole operation
+                import logging
+                logger = logging.getLogger(__name__)
+                logger.warning(f"Failed to delete screenshots from R2: {str(e)}")
+
+        return deleted_count, screenshots_deleted
+
+    def replace_pickup_date(self, pickup_date: str, vehicles: List[Dict]):
+        """
+        Atomically replace all rows for a pickup date with fresh scrape
+        data. The DELETE and the array-insert run back-to-back on one
+        connection inside a single transaction, so the reingest costs two
+        statements total and readers never see a half-replaced day.
+
+        Args:
+            pickup_date: Pickup date (ISO format or YYYY-MM-DD)
+            vehicles: Replacement records for that date
+
+        Returns:
+            Tuple of (rows deleted, list of inserted IDs, one per input row)
+        """
+        try:
+            pickup_dt = _parse_iso(pickup_date)
+        except ValueError:
+            pickup_dt = datetime.strptime(pickup_date.split('T')[0], '%Y-%m-%d')
+        day_start, day_end = _day_bounds(pickup_dt.date(), tz_aware=False)
+
+        rows = [self._vehicle_row(v) for v in vehicles]
+        # Collapse intra-batch natural-key duplicates (last-wins) so the
+        # upsert never hits the same row twice - see insert_vehicles_bulk
+        deduped, keys = _dedupe_rows(rows)
+        with self._tx() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("""
+                    DELETE FROM vehicles
+                    WHERE pickup_date >= %s AND pickup_date < %s
+                """, (day_start, day_end))
+                deleted_count = cursor.rowcount
+                inserted_ids = []
+                if deduped:
+                    # Lists, not tuples - see insert_vehicles_bulk
+                    cursor.execute(self._UNNEST_INSERT_SQL,
+                                   [list(col) for col in zip(*deduped.values())])
+                    id_by_key = dict(zip(deduped,
+                                         (row[0] for row in cursor.fetchall())))
+                    inserted_ids = [id_by_key[key] for key in keys]
+            except Exception as e:
+                raise Exception(f"Failed to replace vehicles for pickup_date: {str(e)}")
+            finally:
+                cursor.close()
+        return deleted_count, inserted_ids
+
+    def replace_combination(self, scrape_datetime: str, city: str,
+                            pickup_date: str, return_date: str,
+                            vehicles: List[Dict]):
+        """
+        Replace all rows for one city-date combination with fresh data.
+        The batch is first COPYed into the UNLOGGED vehicles_stage table
+        (no WAL for the staging write), then one transaction deletes the
+        old rows and moves the staged batch in with INSERT ... SELECT -
+        roughly half the WAL of delete-plus-reinsert and a much shorter
+        lock window on the live table. Natural-key duplicates within the
+        batch are collapsed last-wins during the move, so they count once
+        in the inserted total.
+
+        Args:
+            scrape_datetime: Scrape datetime (ISO format)
+            city: City name
+            pickup_date: Pickup date (ISO format)
+            return_date: Return date (ISO format)
+            vehicles: Replacement records for the combination
+
+        Returns:
+            Tuple of (rows deleted, rows inserted)
+        """
+        scrape_dt = _parse_iso(scrape_datetime)
+        pickup_dt = _parse_iso(pickup_date)
+        return_dt = _parse_iso(return_date)
+        day_start, day_end = _day_bounds(scrape_dt.date())
+
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for vehicle_data in vehicles:
+            writer.writerow([
+                '\\N' if value is None
+                else value.isoformat() if isinstance(value, datetime)
+                else value
+                for value in self._vehicle_row(vehicle_data)
+            ])
+        buf.seek(0)
+
+        with self._tx() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("TRUNCATE vehicles_stage")
+                cursor.copy_expert(
+                    f"COPY vehicles_stage ({_COL_LIST_SQL}) "
+                    "FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                    buf)
+                cursor.execute("""
+                    DELETE FROM vehicles
+                    WHERE scrape_datetime >= %s AND scrape_datetime < %s
+                    AND city = %s
+                    AND pickup_date = %s
+                    AND return_date = %s
+                """, (day_start, day_end, city, pickup_dt, return_dt))
+                deleted_count = cursor.rowcount
+                # DISTINCT ON collapses intra-batch natural-key duplicates
+                # (ctid DESC keeps the last staged row, matching the
+                # last-wins dedupe in insert_vehicles_bulk); the upsert
+                # clause then covers any clash with rows the DELETE above
+                # did not reach. Without both, one duplicate aborts the
+                # transaction after the old rows are already gone.
+                cursor.execute(
+                    f"INSERT INTO vehicles ({_COL_LIST_SQL}) "
+                    "SELECT DISTINCT ON (scrape_datetime, city, pickup_date,"
+                    " return_date, vehicle_name, depot_code) "
+                    f"{_COL_LIST_SQL} FROM vehicles_stage "
+                    "ORDER BY scrape_datetime, city, pickup_date,"
+                    " return_date, vehicle_name, depot_code, ctid DESC"
+                    f"{_ON_CONFLICT_SQL}"
+                )
+                inserted_count = cursor.rowcount
+            except Exception as e:
+                raise Exception(f"Failed to replace vehicles for combination: {str(e)}")
+            finally:
+                cursor.close()
+        return deleted_count, inserted_count
+
+    def delete_vehicles_for_combination(self, scrape_datetime: str, city: str,
                                        pickup_date: str, return_date: str):
         """
         Delete all vehicles for a specific city-date combination.
@@ -579,56 +1198,61 @@ class Database:
         Returns:
             Number of records deleted
         """
-        cursor = self.conn.cursor()
-        try:
-            # Parse datetime strings to TIMESTAMP
-            scrape_dt = datetime.fromisoformat(scrape_datetime.replace('Z', '+00:00'))
-            pickup_dt = datetime.fromisoformat(pickup_date.replace('Z', '+00:00'))
-            return_dt = datetime.fromisoformat(return_date.replace('Z', '+00:00'))
-            
-            cursor.execute("""
-                DELETE FROM vehicles 
-                WHERE DATE(scrape_datetime) = DATE(%s)
-                AND city = %s 
-                AND pickup_date = %s 
-                AND return_date = %s
-            """, (scrape_dt, city, pickup_dt, return_dt))
-            deleted_count = cursor.rowcount
-            self.conn.commit()
-            return deleted_count
-        except Exception as e:
-            self.conn.rollback()
-            raise Exception(f"Failed to delete vehicles: {str(e)}")
-        finally:
-            cursor.close()
+        # Parse datetime strings to TIMESTAMP
+        scrape_dt = _parse_iso(scrape_datetime)
+        pickup_dt = _parse_iso(pickup_date)
+        return_dt = _parse_iso(return_date)
+        day_start, day_end = _day_bounds(scrape_dt.date())
+
+        with self._conn() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("""
+                    DELETE FROM vehicles
+                    WHERE scrape_datetime >= %s AND scrape_datetime < %s
+                    AND city = %s
+                    AND pickup_date = %s
+                    AND return_date = %s
+                """, (day_start, day_end, city, pickup_dt, return_dt))
+                return cursor.rowcount
+            except Exception as e:
+                raise Exception(f"Failed to delete vehicles: {str(e)}")
+            finally:
+                cursor.close()
     
     def clear_all_data(self):
         """
         Clear all data from vehicles table.
         WARNING: This will delete ALL records!
-        
+
         Returns:
-            Number of vehicles deleted
+            Approximate number of vehicles deleted (planner estimate from
+            pg_class.reltuples - an exact COUNT(*) would heap-scan the
+            whole table just to report a number, dwarfing the O(1)
+            TRUNCATE itself)
         """
-        cursor = self.conn.cursor()
-        try:
-            # Get count before deletion
-            cursor.execute("SELECT COUNT(*) FROM vehicles")
-            vehicle_count = cursor.fetchone()[0]
-            
-            # Clear vehicles table
-            cursor.execute("TRUNCATE TABLE vehicles RESTART IDENTITY CASCADE")
-            
-            self.conn.commit()
-            return vehicle_count
-        except Exception as e:
-            self.conn.rollback()
-            raise Exception(f"Failed to clear database: {str(e)}")
-        finally:
-            cursor.close()
-    
+        with self._conn() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = 'vehicles'"
+                )
+                vehicle_count = max(cursor.fetchone()[0], 0)
+
+                # Clear vehicles table
+                cursor.execute("TRUNCATE TABLE vehicles RESTART IDENTITY CASCADE")
+
+                return vehicle_count
+            except Exception as e:
+                raise Exception(f"Failed to clear database: {str(e)}")
+            finally:
+                cursor.close()
+
     def close(self):
-        """Close database connection."""
-        if self.conn:
-            self.conn.close()
-            self.conn = None
+        """Close all pooled database connections."""
+        if self.pool:
+            self.pool.closeall()
+            self.pool = None
+        # Closing the connections deallocates their prepared statements
+        # server-side; drop our references so the tracking set empties too
+        self._prepared_conns.clear()
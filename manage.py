@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Unified management CLI for destructive maintenance tasks.
+
+Consolidates clear_database.py and clear_r2_screenshots.py into one
+process so a combined clear pays interpreter and boto3 import cost once,
+and runs the independent DB and R2 clears in parallel threads.
+"""
+import argparse
+import sys
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler(sys.stdout)
+    ]
+)
+logger = logging.getLogger(__name__)
+
+
+def confirm(warning: str, assume_yes: bool = False) -> bool:
+    """Print a warning banner and ask for confirmation."""
+    print("="*60)
+    print(f"WARNING: {warning}")
+    print("="*60)
+    if assume_yes:
+        return True
+    response = input("Are you sure you want to continue? (yes/no): ")
+    return response.lower() == 'yes'
+
+
+def run_clear_db():
+    """Clear all data from the vehicles table."""
+    from clear_database import clear_database
+    clear_database()
+
+
+def run_clear_r2(lifecycle: bool = False):
+    """Clear (or lifecycle-expire) all screenshots in R2."""
+    from clear_r2_screenshots import clear_r2_screenshots, expire_r2_screenshots
+    if lifecycle:
+        expire_r2_screenshots()
+    else:
+        clear_r2_screenshots()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DriveNow scraper management commands")
+    parser.add_argument('--yes', action='store_true',
+                        help="Skip the confirmation prompt")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('clear-db', help="Delete all rows from the vehicles table")
+
+    clear_r2_parser = subparsers.add_parser(
+        'clear-r2', help="Delete all screenshot files from R2 storage")
+    clear_r2_parser.add_argument(
+        '--lifecycle', action='store_true',
+        help="Expire via a lifecycle rule (one API call, deletion within ~1 day)")
+
+    clear_all_parser = subparsers.add_parser(
+        'clear-all', help="Clear database and R2 screenshots concurrently")
+    clear_all_parser.add_argument(
+        '--lifecycle', action='store_true',
+        help="Expire R2 screenshots via a lifecycle rule instead of deleting now")
+
+    args = parser.parse_args()
+
+    if args.command == 'clear-db':
+        if not confirm("This will delete ALL data from vehicles table!", args.yes):
+            print("Operation cancelled.")
+            sys.exit(0)
+        run_clear_db()
+    elif args.command == 'clear-r2':
+        if not confirm("This will delete ALL screenshot files from R2 storage!", args.yes):
+            print("Operation cancelled.")
+            sys.exit(0)
+        run_clear_r2(lifecycle=args.lifecycle)
+    elif args.command == 'clear-all':
+        if not confirm("This will delete ALL vehicles data AND ALL R2 screenshots!", args.yes):
+            print("Operation cancelled.")
+            sys.exit(0)
+        # The DB truncate and the R2 clear touch independent systems, so
+        # overlap their latency instead of running them back to back
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            db_future = executor.submit(run_clear_db)
+            r2_future = executor.submit(run_clear_r2, args.lifecycle)
+            db_future.result()
+            r2_future.result()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,11 @@
 Collect vehicle data and capture results page screenshots.
 This single phase collects all vehicle data and takes one screenshot per city-date combination.
 """
+import asyncio
 import sys
 import logging
 import time
-from pathlib import Path
+from datetime import date
 from database import Database
 from scraper import DriveNowScraper
 from rich.console import Console
@@ -26,15 +27,40 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+async def _run_collection(scraper, db):
+    """
+    Collect all vehicle data and tear the async browser down on the same
+    event loop. One asyncio.run() of this coroutine replaces the old
+    thread-per-phase pattern (worker thread for collection plus a second
+    thread/loop for browser close): no thread-start overhead, no
+    duplicate loop teardown, and KeyboardInterrupt actually reaches
+    Playwright.
+    """
+    try:
+        await scraper._collect_all_vehicles_parallel_async(db)
+    finally:
+        try:
+            await asyncio.wait_for(scraper._close_async(), timeout=5.0)
+        except (asyncio.TimeoutError, Exception):
+            # Force cleanup on timeout - asyncio.run cancels any stragglers
+            scraper.async_contexts = []
+            scraper.async_browser = None
+            scraper.async_playwright = None
+
+
 def main():
     """Run scraper: Collect vehicle data and capture results page screenshots."""
     # Start timing
     start_time = time.time()
     
     try:
-        # Load configuration
+        # Load configuration - probe by opening rather than exists():
+        # one syscall, and no race between the check and the scraper
+        # reading the file
         config_path = "config.yaml"
-        if not Path(config_path).exists():
+        try:
+            open(config_path).close()
+        except OSError:
             logger.error(f"Configuration file not found: {config_path}")
             sys.exit(1)
         
@@ -50,93 +76,33 @@ def main():
             # Run collection (includes screenshots)
             console.print(f"[dim]Scraping started at {time.strftime('%H:%M:%S')}[/dim]")
             
-            # Run collection in separate thread with event loop
-            import threading
-            import asyncio
-            
-            def run_collection():
-                new_loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(new_loop)
-                try:
-                    new_loop.run_until_complete(scraper._collect_all_vehicles_parallel_async(db))
-                finally:
-                    # Wait for pending tasks and cancel them before closing
-                    try:
-                        # Give a moment for Playwright's internal cleanup
-                        pending = asyncio.all_tasks(new_loop)
-                        if pending:
-                            for task in pending:
-                                task.cancel()
-                            # Wait briefly for cancellations
-                            new_loop.run_until_complete(
-                                asyncio.gather(*pending, return_exceptions=True)
-                            )
-                    except Exception:
-                        pass  # Ignore errors during cleanup
-                    finally:
-                        new_loop.close()
-            
-            collection_thread = threading.Thread(target=run_collection, daemon=False)
-            collection_thread.start()
-            collection_thread.join()
-            
+            # One event loop on the main thread runs collection and
+            # browser teardown; asyncio.run handles loop cleanup and
+            # cancels leftover tasks itself
+            asyncio.run(_run_collection(scraper, db))
+
             # Calculate and log total scraping duration
             end_time = time.time()
             duration = end_time - start_time
             minutes = int(duration // 60)
             seconds = int(duration % 60)
-            
-            # Close async browser after collection - with timeout
-            try:
-                if scraper.async_contexts or scraper.async_browser:
-                    def close_browser():
-                        new_loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(new_loop)
-                        try:
-                            new_loop.run_until_complete(asyncio.wait_for(scraper._close_async(), timeout=5.0))
-                        except (asyncio.TimeoutError, Exception):
-                            # Force cleanup on timeout
-                            scraper.async_contexts = []
-                            scraper.async_browser = None
-                            scraper.async_playwright = None
-                        finally:
-                            # Wait for pending tasks before closing
-                            try:
-                                pending = asyncio.all_tasks(new_loop)
-                                if pending:
-                                    for task in pending:
-                                        task.cancel()
-                                    new_loop.run_until_complete(
-                                        asyncio.gather(*pending, return_exceptions=True)
-                                    )
-                            except Exception:
-                                pass
-                            finally:
-                                new_loop.close()
-                    close_thread = threading.Thread(target=close_browser, daemon=True)
-                    close_thread.start()
-                    close_thread.join(timeout=6.0)  # Max 6 seconds
-            except:
-                pass
-            
-            # Get summary from database
-            from datetime import datetime
-            today = datetime.now().strftime('%Y-%m-%d')
-            vehicles = db.get_vehicles_by_date(today)
-            total_vehicles = len(vehicles)
-            
+
+            # Get summary from database - one aggregate query covers the
+            # totals, per-city counts and coverage numbers; no row fetch
+            # date.today().isoformat() skips strftime's locale machinery
+            today = date.today().isoformat()
+            summary = db.get_daily_summary(today)
+            total_vehicles = sum(row['total'] for row in summary)
+
             # Display summary
             console.print("\n[bold cyan]Collection Summary[/bold cyan]")
             console.print(f"Total vehicles collected: [bold]{total_vehicles}[/bold]")
-            
-            # Count by city
-            from collections import Counter
-            cities = Counter(v.get('city') for v in vehicles)
-            for city, count in cities.items():
-                console.print(f"  [cyan]{city}:[/cyan] {count} vehicles")
-            
-            vehicles_with_urls = sum(1 for v in vehicles if v.get('detail_url'))
-            vehicles_with_screenshots = sum(1 for v in vehicles if v.get('screenshot_path'))
+
+            for row in summary:
+                console.print(f"  [cyan]{row['city']}:[/cyan] {row['total']} vehicles")
+
+            vehicles_with_urls = sum(row['with_urls'] for row in summary)
+            vehicles_with_screenshots = sum(row['with_screenshots'] for row in summary)
             console.print(f"\n[dim]Vehicles with URLs: {vehicles_with_urls}/{total_vehicles}[/dim]")
             console.print(f"[dim]Vehicles with screenshots: {vehicles_with_screenshots}/{total_vehicles}[/dim]")
             
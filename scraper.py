@@ -11,14 +11,16 @@ from playwright.sync_api import sync_playwright, Browser, Page, BrowserContext,
 from playwright.async_api import async_playwright, Browser as AsyncBrowser, Page as AsyncPage, BrowserContext as AsyncBrowserContext
 from bs4 import BeautifulSoup
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import threading
 import asyncio
 from PIL import Image, ImageDraw, ImageFont
-import pytz
+from zoneinfo import ZoneInfo
 import os
-from cloud_storage import CloudflareR2Storage
+from cloud_storage import get_default_r2
 import re
+from urllib.parse import quote, urljoin
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn, TaskID
 from rich.logging import RichHandler
@@ -35,8 +37,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# AEST timezone (handles both AEST UTC+10 and AEDT UTC+11 automatically)
-AEST = pytz.timezone('Australia/Sydney')
+# AEST timezone (handles both AEST UTC+10 and AEDT UTC+11 automatically).
+# stdlib zoneinfo is C-backed and attaches directly via tzinfo=, so no
+# pytz localize() step is needed
+AEST = ZoneInfo('Australia/Sydney')
 
 
 def get_aest_now():
@@ -44,6 +48,89 @@ def get_aest_now():
     return datetime.now(AEST)
 
 
+# Resource types and third-party hosts aborted at the context router
+# when scraper.block_resources is enabled. Selectors only read text and
+# attributes, so the DOM parses identically without these bytes.
+# Stylesheets and images are deliberately NOT blocked by default lists
+# that include them elsewhere: the full-page screenshots are evidence
+# artifacts and need the page to render properly.
+BLOCKED_RESOURCE_TYPES = {'font', 'media'}
+BLOCKED_URL_PATTERNS = (
+    'google-analytics', 'googletagmanager', 'doubleclick',
+    'hotjar', 'segment.io', 'facebook.net',
+)
+
+# In-browser batch extractor for results listings. One evaluate() call
+# walks every vehicle card and returns plain dicts, replacing the
+# O(vehicles x selectors) query_selector/inner_text/get_attribute CDP
+# round-trips the Python probe loop would otherwise issue per vehicle.
+# Note querySelector here takes plain CSS only - Playwright pseudo
+# selectors like :has-text() don't exist in the renderer, so button
+# detection filters on innerText instead.
+LISTING_EXTRACT_JS = """
+(cardSelectors) => {
+    let cards = [];
+    for (const sel of cardSelectors) {
+        try { cards = [...document.querySelectorAll(sel)]; } catch (e) { cards = []; }
+        if (cards.length) break;
+    }
+    return cards.map((el, idx) => {
+        const nameEl = el.querySelector("h2, h3, h4, [class*='name'], [class*='title']");
+        const priceEl = el.querySelector("[class*='price'], [class*='cost'], [class*='rate']");
+        const priceMatch = (priceEl ? priceEl.innerText : '').replace(/,/g, '').match(/\\d+\\.?\\d*/);
+
+        const candidates = [...el.querySelectorAll("button, a, [role='button']")];
+        let btn = candidates.find(b => /detail|see|view|more|info/i.test(b.innerText || ''));
+        if (!btn) {
+            btn = candidates.find(b => b.matches("a[href*='detail'], a[href*='vehicle'], button"));
+        }
+
+        let url = null;
+        if (btn) {
+            url = btn.href || btn.getAttribute('data-url') || btn.getAttribute('data-href')
+                || btn.getAttribute('data-link');
+            if (!url) {
+                const a = btn.closest('a');
+                if (a) url = a.href;
+            }
+            if (!url) {
+                const onclick = btn.getAttribute('onclick');
+                if (onclick) {
+                    const m = onclick.match(/["']([^"']+)["']/);
+                    if (m) url = m[1];
+                }
+            }
+        }
+
+        return {
+            index: idx,
+            vehicle_name: nameEl ? nameEl.innerText.trim() : null,
+            price: priceMatch ? parseFloat(priceMatch[0]) : null,
+            detail_url: url || null,
+        };
+    });
+}
+"""
+
+@lru_cache(maxsize=128)
+def _city_url_suffix(lat, lng, location, radius):
+    """
+    Static per-city tail of a results URL. Everything after the dates is
+    identical across a city's pickup/return combinations, so the quote()
+    calls run once per city instead of once per combination.
+    """
+    location_encoded = quote(location, safe=',')
+    return (
+        f"{lat},{lng},2/{lat},{lng},2/"
+        f"{location_encoded}/{location_encoded}/"
+        f"AU/30?radius={radius}&pickupCountry=AU&returnCountry=AU&bookingEngine=ube&affiliateCode=drivenow"
+    )
+
+
+# Pre-compiled patterns for the hot per-vehicle extraction loops
+_PRICE_RE = re.compile(r'[\d,]+\.?\d*')
+_QUOTED_RE = re.compile(r'["\']([^"\']+)["\']')
+
 # User agents for rotation
 USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -52,6 +139,28 @@ USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
 ]
 
+# Anti-detection setup shared by the sync and async contexts. All
+# scriptable navigator overrides ride in ONE init script, so each new
+# context pays a single add_init_script CDP call instead of one per
+# override. The headers must travel on the HTTP layer and so stay a
+# set_extra_http_headers call, but the dict itself is built once here.
+ANTI_DETECTION_INIT_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-AU', 'en']
+    });
+"""
+
+EXTRA_HTTP_HEADERS = {
+    'Accept-Language': 'en-AU,en;q=0.9',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
 
 class DriveNowScraper:
     """Scraper for DriveNow.com.au website using Playwright."""
@@ -74,6 +183,8 @@ class DriveNowScraper:
         if is_ci and not self.config['scraper']['headless']:
             logger.info("CI environment detected - forcing headless mode (no display server available)")
         self.page_load_wait = self.config['scraper']['page_load_wait']
+        self.block_resources = self.config['scraper'].get('block_resources', False)
+        self.share_context = self.config['scraper'].get('share_context', False)
         self.screenshot_enabled = self.config['scraper']['screenshot']['enabled']
         self.screenshot_dir = Path(self.config['scraper']['screenshot']['directory'])
         self.screenshot_dir.mkdir(exist_ok=True)
@@ -83,7 +194,7 @@ class DriveNowScraper:
         self.cloud_storage = None
         if self.use_cloud_storage:
             try:
-                self.cloud_storage = CloudflareR2Storage()
+                self.cloud_storage = get_default_r2()
                 logger.info("Cloudflare R2 storage initialized")
             except Exception as e:
                 logger.warning(f"Failed to initialize cloud storage: {str(e)}. Falling back to local storage.")
@@ -127,11 +238,42 @@ class DriveNowScraper:
         self.async_browser = None
         self.async_playwright = None
         self.db_lock = threading.Lock()  # Thread-safe database access
+        # Dedicated thread for blocking psycopg2 calls made from async
+        # workers: run on the event loop they would stall every
+        # concurrent Playwright await for the duration of the round-trip
+        self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='db-writer')
+        # Persistent pool for blocking screenshot compression/upload work;
+        # workers await it via run_in_executor rather than spinning up a
+        # throwaway thread per combination
+        self._io_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='screenshot-io')
         self.depot_cache = {}  # Cache depot data per city to avoid multiple API calls
         self.depot_api_lock = None  # Will be initialized in async context
         self.last_depot_api_call_time = None  # Track last API call time for rate limiting (wall-clock time)
         self._setup_browser()
     
+    def _should_block_request(self, request) -> bool:
+        """Decide whether a request carries bytes the scrape never reads."""
+        if request.resource_type in BLOCKED_RESOURCE_TYPES:
+            return True
+        # Vehicle photos only matter when pages are screenshotted as evidence
+        if request.resource_type == 'image' and not self.screenshot_enabled:
+            return True
+        return any(pattern in request.url for pattern in BLOCKED_URL_PATTERNS)
+
+    def _route_filter(self, route):
+        """Sync context.route handler aborting non-essential requests."""
+        if self._should_block_request(route.request):
+            route.abort()
+        else:
+            route.continue_()
+
+    async def _route_filter_async(self, route):
+        """Async context.route handler aborting non-essential requests."""
+        if self._should_block_request(route.request):
+            await route.abort()
+        else:
+            await route.continue_()
+
     def _create_browser_context(self, user_agent: str = None) -> BrowserContext:
         """Create a browser context with anti-detection measures."""
         context_options = {
@@ -154,23 +296,18 @@ class DriveNowScraper:
             }
         
         context = self.browser.new_context(**context_options)
-        
+
         # Add extra HTTP headers
-        context.set_extra_http_headers({
-            'Accept-Language': 'en-AU,en;q=0.9',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
-        
-        # Override webdriver property
-        context.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-        """)
-        
+        context.set_extra_http_headers(EXTRA_HTTP_HEADERS)
+
+        # All navigator overrides in one batched init script
+        context.add_init_script(ANTI_DETECTION_INIT_SCRIPT)
+
+        # Drop fonts, media and analytics at the router - the scrape only
+        # reads text and attributes, so these bytes are pure overhead
+        if self.block_resources:
+            context.route("**/*", self._route_filter)
+
         return context
     
     def _setup_browser(self):
@@ -225,7 +362,7 @@ class DriveNowScraper:
                 pickup_date_only = datetime.strptime(manual_pickup_date_str, '%Y-%m-%d').date()
                 pickup_date = datetime.combine(pickup_date_only, datetime.min.time().replace(hour=10, minute=0, second=0, microsecond=0))
                 # Ensure timezone-aware
-                pickup_date = AEST.localize(pickup_date)
+                pickup_date = pickup_date.replace(tzinfo=AEST)
                 console.print(f"[dim]Using pickup date: {pickup_date.strftime('%Y-%m-%d %H:%M')} AEST[/dim]")
             except ValueError as e:
                 logger.error(f"Invalid PICKUP_DATE format '{manual_pickup_date_str}'. Expected YYYY-MM-DD. Using default logic.")
@@ -245,13 +382,13 @@ class DriveNowScraper:
             if is_ci:
                 # Running in CI: pickup date is same day at 10 AM
                 pickup_date = datetime.combine(today, datetime.min.time().replace(hour=10, minute=0, second=0, microsecond=0))
-                pickup_date = AEST.localize(pickup_date)
+                pickup_date = pickup_date.replace(tzinfo=AEST)
                 console.print(f"[dim]Pickup date: {pickup_date.strftime('%Y-%m-%d %H:%M')} AEST (same day)[/dim]")
             else:
                 # Manual testing: pickup date is next day at 10 AM
                 next_day = today + timedelta(days=1)
                 pickup_date = datetime.combine(next_day, datetime.min.time().replace(hour=10, minute=0, second=0, microsecond=0))
-                pickup_date = AEST.localize(pickup_date)
+                pickup_date = pickup_date.replace(tzinfo=AEST)
                 console.print(f"[dim]Pickup date: {pickup_date.strftime('%Y-%m-%d %H:%M')} AEST (next day)[/dim]")
         
         # Return dates: Based on return_days config (e.g., [1, 7] means +1 day and +7 days from pickup)
@@ -278,30 +415,23 @@ class DriveNowScraper:
     
     def _build_results_url(self, city: Dict, pickup_date: datetime, return_date: datetime) -> str:
         """Build the results URL directly based on the URL pattern."""
-        from urllib.parse import quote
-        
+
         pickup_date_str = self._format_date_for_url(pickup_date)
         pickup_time_str = self._format_time_for_url(pickup_date)
         return_date_str = self._format_date_for_url(return_date)
         return_time_str = self._format_time_for_url(return_date)
-        
-        lat = city['latitude']
-        lng = city['longitude']
-        location = city['location_string']
-        radius = city.get('radius', 3)
-        
-        location_encoded = quote(location, safe=',')
-        
-        url = (
+
+        suffix = _city_url_suffix(
+            city['latitude'], city['longitude'],
+            city['location_string'], city.get('radius', 3)
+        )
+
+        return (
             f"{self.results_base_url}/"
             f"{pickup_date_str}/{pickup_time_str}/"
             f"{return_date_str}/{return_time_str}/"
-            f"{lat},{lng},2/{lat},{lng},2/"
-            f"{location_encoded}/{location_encoded}/"
-            f"AU/30?radius={radius}&pickupCountry=AU&returnCountry=AU&bookingEngine=ube&affiliateCode=drivenow"
+            f"{suffix}"
         )
-        
-        return url
     
     def _wait_for_page_load(self, page: Page, timeout: int = None) -> bool:
         """Wait for page to be loaded with actual content."""
@@ -317,35 +447,88 @@ class DriveNowScraper:
                 page.wait_for_load_state("networkidle", timeout=min(timeout, 10000))
             except:
                 pass  # Continue even if networkidle times out
-            
-            # Wait for JavaScript to execute and content to render
-            time.sleep(1)
-            
-            # Verify page has content
+
+            # Wait for rendered content rather than sleeping a fixed
+            # budget: returns the moment the body has real text
             try:
-                body_text = page.evaluate("() => document.body.innerText")
-                if len(body_text) < 20:
-                    logger.warning("Page has very little text content")
-                    time.sleep(2)  # Wait more for content to load
+                page.wait_for_function(
+                    "() => document.body && document.body.innerText.length >= 20",
+                    timeout=min(timeout, 5000)
+                )
             except:
-                pass
-            
+                logger.warning("Page has very little text content")
+
             return True
         except PlaywrightTimeout:
             logger.warning("Page load timeout, but continuing...")
             return False
     
+    def _extract_listings_batch(self, page: Page, card_selectors: List[str]) -> List[Dict]:
+        """
+        Extract all vehicle listings in one in-browser pass.
+
+        Returns the same vehicle dicts as the probe loop (including
+        detail_button handles for the click fallback), or an empty list
+        if the batch extractor found nothing - callers then fall back to
+        the per-element selector walk.
+        """
+        try:
+            rows = page.evaluate(LISTING_EXTRACT_JS, card_selectors)
+        except Exception as e:
+            logger.debug(f"Batch listing extraction failed: {str(e)}")
+            return []
+
+        if not rows:
+            return []
+
+        vehicles = []
+        for row in rows:
+            detail_url = row.get('detail_url')
+            if detail_url and not detail_url.startswith('http'):
+                detail_url = urljoin(page.url, detail_url)
+            vehicles.append({
+                'index': row['index'],
+                'vehicle_name': row.get('vehicle_name') or f"Vehicle {row['index'] + 1}",
+                'price': row.get('price'),
+                'detail_url': detail_url,
+            })
+
+        # One list query attaches live button handles for the click
+        # fallback - still a single CDP round-trip for the whole page
+        detail_selectors = [
+            "button:has-text('See Details')",
+            "a:has-text('See Details')",
+            "button:has-text('Details')",
+            "a:has-text('Details')",
+            "button[class*='details']",
+            "a[class*='details']",
+            "button[class*='detail']",
+            "a[class*='detail']",
+        ]
+        buttons = []
+        for selector in detail_selectors:
+            try:
+                buttons = page.query_selector_all(selector)
+                if buttons:
+                    break
+            except:
+                continue
+        for vehicle in vehicles:
+            if vehicle['index'] < len(buttons):
+                vehicle['detail_button'] = buttons[vehicle['index']]
+
+        # Without either a URL or a button a vehicle can't be opened
+        vehicles = [v for v in vehicles if v['detail_url'] or v.get('detail_button')]
+        return vehicles
+
     def _get_vehicle_listings(self, page: Page) -> List[Dict]:
         """
         Extract vehicle listings from the results page.
         Returns list of vehicle info with selectors for "See Details" buttons.
         """
         vehicles = []
-        
+
         try:
-            # Wait for dynamic content to load
-            time.sleep(1)
-            
             # Wait for vehicle listings to appear
             vehicle_selectors = [
                 ".vehicle-card",
@@ -357,7 +540,21 @@ class DriveNowScraper:
                 "[data-testid*='vehicle']",
                 "[data-testid*='car']",
             ]
-            
+
+            # Wait for the first card to attach instead of sleeping a
+            # fixed second - returns as soon as dynamic content lands
+            try:
+                page.wait_for_selector(", ".join(vehicle_selectors), state="attached", timeout=5000)
+            except PlaywrightTimeout:
+                pass  # Fall through; the extractors handle an empty page
+
+            # Single in-browser pass first: one evaluate() replaces the
+            # per-vehicle selector probing below
+            vehicles = self._extract_listings_batch(page, vehicle_selectors)
+            if vehicles:
+                logger.info(f"Found {len(vehicles)} vehicles via batch extractor")
+                return vehicles
+
             vehicle_elements = []
             for selector in vehicle_selectors:
                 try:
@@ -454,8 +651,7 @@ class DriveNowScraper:
                             price_elem = element.query_selector("[class*='price'], [class*='cost'], [class*='rate']")
                             if price_elem:
                                 price_text = price_elem.inner_text().strip()
-                                import re
-                                price_match = re.search(r'[\d,]+\.?\d*', price_text.replace(',', ''))
+                                price_match = _PRICE_RE.search(price_text.replace(',', ''))
                                 if price_match:
                                     price = float(price_match.group().replace(',', ''))
                             
@@ -464,14 +660,12 @@ class DriveNowScraper:
                                 if see_details_button.get_attribute('href'):
                                     detail_url = see_details_button.get_attribute('href')
                                     if detail_url and not detail_url.startswith('http'):
-                                        from urllib.parse import urljoin
                                         detail_url = urljoin(page.url, detail_url)
                                 else:
                                     # Try onclick handler
                                     onclick = see_details_button.evaluate('el => el.getAttribute("onclick")')
                                     if onclick:
-                                        import re
-                                        match = re.search(r'["\']([^"\']+)["\']', onclick)
+                                        match = _QUOTED_RE.search(onclick)
                                         if match:
                                             detail_url = match.group(1)
                                     
@@ -483,8 +677,13 @@ class DriveNowScraper:
                                         if data_url:
                                             detail_url = data_url
                                             if not detail_url.startswith('http'):
-                                                from urllib.parse import urljoin
                                                 detail_url = urljoin(page.url, detail_url)
+
+                                    # Last resort: button nested inside an anchor
+                                    if not detail_url:
+                                        detail_url = see_details_button.evaluate(
+                                            "el => el.closest('a') ? el.closest('a').href : null"
+                                        )
                             except:
                                 pass
                         except:
@@ -571,8 +770,7 @@ class DriveNowScraper:
                         price_elem = element.query_selector("[class*='price'], [class*='cost']")
                         if price_elem:
                             price_text = price_elem.inner_text().strip()
-                            import re
-                            price_match = re.search(r'[\d,]+\.?\d*', price_text.replace(',', ''))
+                            price_match = _PRICE_RE.search(price_text.replace(',', ''))
                             if price_match:
                                 price = float(price_match.group().replace(',', ''))
                     except:
@@ -585,14 +783,12 @@ class DriveNowScraper:
                             if see_details_button.get_attribute('href'):
                                 detail_url = see_details_button.get_attribute('href')
                                 if detail_url and not detail_url.startswith('http'):
-                                    from urllib.parse import urljoin
                                     detail_url = urljoin(page.url, detail_url)
                             else:
                                 # Try onclick handler
                                 onclick = see_details_button.evaluate('el => el.getAttribute("onclick")')
                                 if onclick:
-                                    import re
-                                    match = re.search(r'["\']([^"\']+)["\']', onclick)
+                                    match = _QUOTED_RE.search(onclick)
                                     if match:
                                         detail_url = match.group(1)
                                 
@@ -604,8 +800,13 @@ class DriveNowScraper:
                                     if data_url:
                                         detail_url = data_url
                                         if not detail_url.startswith('http'):
-                                            from urllib.parse import urljoin
                                             detail_url = urljoin(page.url, detail_url)
+
+                                # Last resort: button nested inside an anchor
+                                if not detail_url:
+                                    detail_url = see_details_button.evaluate(
+                                        "el => el.closest('a') ? el.closest('a').href : null"
+                                    )
                         except:
                             pass
                         
@@ -628,90 +829,107 @@ class DriveNowScraper:
             logger.error(f"Error extracting vehicle listings: {str(e)}")
             return []
     
-    async def _scrape_vehicle_detail_worker_async(self, context: AsyncBrowserContext, vehicle: Dict, 
+    async def _scrape_vehicle_detail_worker_async(self, page_pool: asyncio.Queue, vehicle: Dict,
                                                   results_url: str, city_name: str,
-                                                  pickup_date: datetime, return_date: datetime, 
+                                                  pickup_date: datetime, return_date: datetime,
                                                   scrape_timestamp: str) -> Optional[Dict]:
         """
         Worker function to scrape a single vehicle detail page.
-        Used for parallel processing - processes one vehicle independently.
+        Used for parallel processing - borrows a pre-warmed page from the
+        pool instead of paying a new_page() allocation per vehicle, and
+        only re-navigates to the results page when the page has moved off
+        it (a freshly warmed page skips the load entirely).
         """
-        page = None
+        page = await page_pool.get()
         try:
-            page = await context.new_page()
-            
-            # Navigate to results page first
-            await page.goto(results_url, wait_until="domcontentloaded", timeout=15000)
-            await asyncio.sleep(0.5)  # Quick wait for initial load
-            
-            # Wait for page to be ready
-            try:
-                await page.wait_for_load_state("domcontentloaded", timeout=8000)
-            except:
-                pass
-            
-            # Find the "See Details" button for this vehicle
-            # We need to find it by vehicle name or index
-            vehicle_index = vehicle.get('index', 0)
-            see_details_button = None
-            
-            # Try to find the button using various selectors
-            detail_selectors = [
-                f"button:has-text('See Details')",
-                f"a:has-text('See Details')",
-                f"button:has-text('Details')",
-                f"a:has-text('Details')",
-            ]
-            
-            # Get all detail buttons and click the one at vehicle_index
-            for selector in detail_selectors:
+            detail_url = vehicle.get('detail_url')
+            if detail_url:
+                # Fast path: the listings pass already harvested the
+                # detail URL, so navigate straight there - one page load
+                # instead of a results-page render plus a button click
+                logger.info(f"[Worker] Navigating directly to detail page for vehicle: {vehicle.get('vehicle_name', 'Unknown')}")
+                await page.goto(detail_url, wait_until="domcontentloaded", timeout=15000)
+            else:
+                # Fallback: reload the results page and click through
+                # Navigate to results page unless the page is already on it
+                if page.url != results_url:
+                    await page.goto(results_url, wait_until="domcontentloaded", timeout=15000)
+
+                # Wait for page to be ready
                 try:
-                    buttons = await page.query_selector_all(selector)
-                    if buttons and len(buttons) > vehicle_index:
-                        see_details_button = buttons[vehicle_index]
-                        break
+                    await page.wait_for_load_state("domcontentloaded", timeout=8000)
                 except:
-                    continue
-            
-            if not see_details_button:
-                # Fallback: try to find by vehicle card index
-                vehicle_selectors = [
-                    ".vehicle-card",
-                    ".car-card",
-                    ".vehicle-item",
-                    "[class*='vehicle']",
+                    pass
+
+                # Find the "See Details" button for this vehicle
+                # We need to find it by vehicle name or index
+                vehicle_index = vehicle.get('index', 0)
+                see_details_button = None
+
+                # Try to find the button using various selectors
+                detail_selectors = [
+                    f"button:has-text('See Details')",
+                    f"a:has-text('See Details')",
+                    f"button:has-text('Details')",
+                    f"a:has-text('Details')",
                 ]
-                
-                for card_selector in vehicle_selectors:
+
+                # Wait for a button to attach instead of a fixed sleep -
+                # returns the moment the listings hydrate
+                try:
+                    await page.wait_for_selector(", ".join(detail_selectors), state="attached", timeout=5000)
+                except:
+                    pass
+
+                # Get all detail buttons and click the one at vehicle_index
+                for selector in detail_selectors:
                     try:
-                        cards = await page.query_selector_all(card_selector)
-                        if cards and len(cards) > vehicle_index:
-                            card = cards[vehicle_index]
-                            # Find button within this card
-                            for detail_selector in detail_selectors:
-                                btn = await card.query_selector(detail_selector)
-                                if btn:
-                                    see_details_button = btn
-                                    break
-                            if see_details_button:
-                                break
+                        buttons = await page.query_selector_all(selector)
+                        if buttons and len(buttons) > vehicle_index:
+                            see_details_button = buttons[vehicle_index]
+                            break
                     except:
                         continue
-            
-            if not see_details_button:
-                raise Exception(f"Could not find 'See Details' button for vehicle {vehicle_index}")
-            
-            # Click "See Details" button
-            logger.info(f"[Worker] Clicking 'See Details' for vehicle: {vehicle.get('vehicle_name', 'Unknown')}")
-            
-            # Click and wait for navigation or content
-            try:
-                async with page.expect_navigation(timeout=8000, wait_until="domcontentloaded"):
-                    await see_details_button.click()
-            except:
-                # No navigation - might be modal, just wait a bit
-                await asyncio.sleep(1)
-            
+
+                if not see_details_button:
+                    # Fallback: try to find by vehicle card index
+                    vehicle_selectors = [
+                        ".vehicle-card",
+                        ".car-card",
+                        ".vehicle-item",
+                        "[class*='vehicle']",
+                    ]
+
+                    for card_selector in vehicle_selectors:
+                        try:
+                            cards = await page.query_selector_all(card_selector)
+                            if cards and len(cards) > vehicle_index:
+                                card = cards[vehicle_index]
+                                # Find button within this card
+                                for detail_selector in detail_selectors:
+                                    btn = await card.query_selector(detail_selector)
+                                    if btn:
+                                        see_details_button = btn
+                                        break
+                                if see_details_button:
+                                    break
+                        except:
+                            continue
+
+                if not see_details_button:
+                    raise Exception(f"Could not find 'See Details' button for vehicle {vehicle_index}")
+
+                # Click "See Details" button
+                logger.info(f"[Worker] Clicking 'See Details' for vehicle: {vehicle.get('vehicle_name', 'Unknown')}")
+
+                # Click and wait for navigation or content
+                try:
+                    async with page.expect_navigation(timeout=8000, wait_until="domcontentloaded"):
+                        await see_details_button.click()
+                except:
+                    # No navigation - might be modal, just wait a bit
+                    await asyncio.sleep(1)
+
             # Wait for content to load (reasonable wait for proper rendering)
             try:
                 await page.wait_for_load_state("domcontentloaded", timeout=8000)
@@ -756,9 +974,8 @@ class DriveNowScraper:
                 'error': str(e)
             }
         finally:
-            if page:
-                await page.close()
-    
+            await page_pool.put(page)
+
     async def _wait_for_page_load_async(self, page: AsyncPage, timeout: int = None):
         """Wait for page to be loaded (async version - reasonable waits)."""
         if timeout is None:
@@ -800,7 +1017,6 @@ class DriveNowScraper:
                     # Try to get URL from onclick handler
                     onclick = vehicle['detail_button'].evaluate('el => el.getAttribute("onclick")')
                     if onclick and 'href' in onclick:
-                        import re
                         match = re.search(r'href=["\']([^"\']+)["\']', onclick)
                         if match:
                             detail_url = match.group(1)
@@ -1132,44 +1348,22 @@ class DriveNowScraper:
         
         # Use specified workers or default to parallel_workers
         workers = num_workers or self.workers
-        
+
+        if self.share_context:
+            # One context, many pages: every worker page rides the same
+            # cookie jar and HTTP/2 session to the site, so only the
+            # first request pays the connection handshake. The list
+            # still holds one slot per worker so round-robin assignment
+            # and semaphore sizing work unchanged.
+            if not self.async_contexts:
+                self.async_contexts = [await self._create_async_context()]
+            self.async_contexts = [self.async_contexts[0]] * workers
+            return
+
         # Only create new contexts if we need more
         while len(self.async_contexts) < workers:
-            context_options = {
-                'viewport': {
-                    'width': self.config['scraper']['window_width'],
-                    'height': self.config['scraper']['window_height']
-                },
-                'user_agent': random.choice(USER_AGENTS),
-                'locale': 'en-AU',
-                'timezone_id': 'Australia/Sydney',
-            }
-            
-            if self.randomize_viewport:
-                base_width = self.config['scraper']['window_width']
-                base_height = self.config['scraper']['window_height']
-                context_options['viewport'] = {
-                    'width': base_width + random.randint(-50, 50),
-                    'height': base_height + random.randint(-50, 50)
-                }
-            
-            context = await self.async_browser.new_context(**context_options)
-            await context.set_extra_http_headers({
-                'Accept-Language': 'en-AU,en;q=0.9',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-            })
-            
-            await context.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-            """)
-            
-            self.async_contexts.append(context)
-        
+            self.async_contexts.append(await self._create_async_context())
+
         # Trim contexts if we have too many
         if len(self.async_contexts) > workers:
             excess = self.async_contexts[workers:]
@@ -1179,6 +1373,38 @@ class DriveNowScraper:
                 except:
                     pass
             self.async_contexts = self.async_contexts[:workers]
+
+    async def _create_async_context(self) -> AsyncBrowserContext:
+        """Create one async browser context with anti-detection measures."""
+        context_options = {
+            'viewport': {
+                'width': self.config['scraper']['window_width'],
+                'height': self.config['scraper']['window_height']
+            },
+            'user_agent': random.choice(USER_AGENTS),
+            'locale': 'en-AU',
+            'timezone_id': 'Australia/Sydney',
+        }
+
+        if self.randomize_viewport:
+            base_width = self.config['scraper']['window_width']
+            base_height = self.config['scraper']['window_height']
+            context_options['viewport'] = {
+                'width': base_width + random.randint(-50, 50),
+                'height': base_height + random.randint(-50, 50)
+            }
+
+        context = await self.async_browser.new_context(**context_options)
+        await context.set_extra_http_headers(EXTRA_HTTP_HEADERS)
+
+        # All navigator overrides in one batched init script
+        await context.add_init_script(ANTI_DETECTION_INIT_SCRIPT)
+
+        # Same non-essential-request blocking as the sync contexts
+        if self.block_resources:
+            await context.route("**/*", self._route_filter_async)
+
+        return context
     
     async def _scrape_vehicles_parallel_async(self, vehicles: List[Dict], results_url: str,
                                               city_name: str, pickup_date: datetime, return_date: datetime,
@@ -1186,30 +1412,58 @@ class DriveNowScraper:
         """Scrape vehicles in parallel using async API."""
         # Set up async browser if not already done
         await self._setup_async_browser()
-        
+
+        # Pre-warm one page per context and keep them resident in a pool
+        # for the whole run: workers borrow instead of allocating, which
+        # drops N page creations and N-1 results-page loads per city
+        page_pool = asyncio.Queue()
+        for context in self.async_contexts:
+            page = await context.new_page()
+            try:
+                await page.goto(results_url, wait_until="domcontentloaded", timeout=15000)
+            except Exception:
+                # Worker re-navigates on borrow if the warm-up load failed
+                pass
+            await page_pool.put(page)
+
+        try:
+            await self._scrape_vehicle_batches_async(
+                page_pool, vehicles, results_url, city_name, pickup_date,
+                return_date, scrape_date, scrape_timestamp, db, all_vehicles
+            )
+        finally:
+            while not page_pool.empty():
+                try:
+                    await (page_pool.get_nowait()).close()
+                except Exception:
+                    pass
+
+    async def _scrape_vehicle_batches_async(self, page_pool: asyncio.Queue, vehicles: List[Dict],
+                                            results_url: str, city_name: str,
+                                            pickup_date: datetime, return_date: datetime,
+                                            scrape_date: str, scrape_timestamp: str, db,
+                                            all_vehicles: List[Dict]):
+        """Run the batched detail-page workers against the page pool."""
         # Process vehicles in batches
         for batch_start in range(0, len(vehicles), self.batch_size):
             batch_end = min(batch_start + self.batch_size, len(vehicles))
             batch = vehicles[batch_start:batch_end]
-            
+
             logger.debug(f"Processing batch {batch_start//self.batch_size + 1}: vehicles {batch_start + 1}-{batch_end} of {len(vehicles)}")
-            
-            # Create tasks for all vehicles in batch
+
+            # Create tasks for all vehicles in batch; workers pace
+            # themselves on the shared page pool
             tasks = []
-            for idx, vehicle in enumerate(batch):
-                # Assign worker context (round-robin)
-                worker_idx = (batch_start + idx) % len(self.async_contexts)
-                context = self.async_contexts[worker_idx]
-                
+            for vehicle in batch:
                 task = self._scrape_vehicle_detail_worker_async(
-                    context, vehicle, results_url, city_name,
+                    page_pool, vehicle, results_url, city_name,
                     pickup_date, return_date, scrape_timestamp
                 )
                 tasks.append((task, vehicle))
-            
+
             # Run all tasks concurrently
             results = await asyncio.gather(*[t[0] for t in tasks], return_exceptions=True)
-            
+
             # Process results
             for (task, vehicle), result in zip(tasks, results):
                 try:
@@ -1235,9 +1489,8 @@ class DriveNowScraper:
                             'screenshot_path': result.get('screenshot_path'),
                         }
                         
-                        with self.db_lock:
-                            db.insert_vehicle(vehicle_data)
-                            all_vehicles.append(vehicle_data)
+                        await self._db_write(db.insert_vehicle, vehicle_data)
+                        all_vehicles.append(vehicle_data)
                         
                         logger.info(f"✓ Saved: {result.get('vehicle_name', 'Unknown')}")
                     else:
@@ -1252,6 +1505,23 @@ class DriveNowScraper:
                 logger.info(f"Waiting {batch_delay:.1f} seconds before next screenshot batch to avoid detection...")
                 await asyncio.sleep(batch_delay)
     
+    async def _db_write(self, fn, *args):
+        """
+        Run a blocking database call on the dedicated DB thread.
+
+        psycopg2 blocks in C for the whole server round-trip; awaiting it
+        through run_in_executor keeps the Playwright event loop free. The
+        single-thread executor serializes writes, and taking db_lock on
+        that thread keeps them ordered with the remaining sync callers.
+        """
+        loop = asyncio.get_running_loop()
+
+        def call():
+            with self.db_lock:
+                return fn(*args)
+
+        return await loop.run_in_executor(self._db_executor, call)
+
     def _scrape_vehicles_parallel(self, vehicles: List[Dict], results_url: str,
                                   city_name: str, pickup_date: datetime, return_date: datetime,
                                   scrape_date: str, scrape_timestamp: str, db, all_vehicles: List[Dict]):
@@ -1288,7 +1558,9 @@ class DriveNowScraper:
             scrape_timestamp = dt.strftime("%Y%m%d_%H%M%S")
         except:
             scrape_timestamp = get_aest_now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{city_safe}_{pickup_str}_{return_str}_results_{scrape_timestamp}.png"
+        # .jpg: captured directly as JPEG so the browser never pays for
+        # PNG zlib encoding and the CDP transfer is a fraction of the size
+        filename = f"{city_safe}_{pickup_str}_{return_str}_results_{scrape_timestamp}.jpg"
         return str(self.screenshot_dir / filename)
     
     def _add_watermark(self, img: Image.Image, screenshot_time: str, interval: int = 1000) -> Image.Image:
@@ -1309,7 +1581,7 @@ class DriveNowScraper:
                 dt = datetime.fromisoformat(screenshot_time.replace('Z', '+00:00'))
                 # Convert to AEST if needed (should already be in AEST)
                 if dt.tzinfo is None:
-                    dt = AEST.localize(dt)
+                    dt = dt.replace(tzinfo=AEST)
                 elif dt.tzinfo != AEST:
                     dt = dt.astimezone(AEST)
                 # Format: "Screenshot Time: 2024-11-19 10:30:45 AEST"
@@ -1413,9 +1685,9 @@ class DriveNowScraper:
                     img = self._add_watermark(img, screenshot_time, interval=2000)
                     logger.debug(f"Added watermark to screenshot with timestamp: {screenshot_time}")
                 
-                # Convert PNG path to JPEG path
+                # Convert PNG path to JPEG path (no-op for JPEG captures)
                 jpeg_path = screenshot_path.replace('.png', '.jpg')
-                
+
                 # Save as JPEG with quality setting (much better compression than PNG)
                 img.save(
                     jpeg_path,
@@ -1423,9 +1695,11 @@ class DriveNowScraper:
                     quality=quality,
                     optimize=True
                 )
-                
-                # Remove original PNG file
-                os.remove(screenshot_path)
+
+                # Remove the original only when the save went to a new
+                # path; JPEG captures are re-saved in place
+                if jpeg_path != screenshot_path:
+                    os.remove(screenshot_path)
             
             # Get compressed file size
             compressed_size = os.path.getsize(jpeg_path)
@@ -1577,88 +1851,99 @@ class DriveNowScraper:
                         city_name, pickup_date, return_date, scrape_datetime
                     )
                     
-                    # Take full page screenshot (page is already fully loaded)
-                    await page.screenshot(path=original_screenshot_path, full_page=True, timeout=30000)
+                    # Take full page screenshot (page is already fully loaded).
+                    # JPEG at the capture stage: the browser skips PNG
+                    # encoding, its screenshot queue drains faster, and the
+                    # compression pass only needs to watermark/resize
+                    await page.screenshot(path=original_screenshot_path, full_page=True,
+                                          timeout=30000, type='jpeg', quality=80)
                     
                     # Compress and upload to get R2 URL before saving vehicles
                     # This ensures screenshot_path in database is the R2 URL, not local path
-                    # Run in thread pool to avoid blocking async event loop, but wait for completion
-                    import concurrent.futures
-                    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                        def compress_and_upload():
-                            try:
-                                # Compress screenshot first (with watermark)
-                                success, compressed_path = self._compress_screenshot(
-                                    original_screenshot_path, 
-                                    screenshot_time=scrape_datetime
-                                )
-                                final_path = compressed_path if success else original_screenshot_path
-                                
-                                # Upload to cloud storage if enabled
-                                if self.use_cloud_storage and self.cloud_storage:
-                                    try:
-                                        # Generate remote path (same structure as local)
-                                        remote_path = final_path.replace(str(self.screenshot_dir), '').lstrip('/')
-                                        cloud_url = self.cloud_storage.upload_file(
-                                            final_path,
-                                            remote_path,
-                                            content_type='image/jpeg' if final_path.endswith('.jpg') else 'image/png'
-                                        )
-                                        
-                                        if cloud_url:
-                                            # Delete local file after successful upload
-                                            try:
-                                                os.remove(final_path)
-                                            except:
-                                                pass
-                                            return cloud_url
-                                        else:
-                                            logger.warning(f"[Worker] Cloud upload succeeded but no URL returned for {city_name}")
-                                            return final_path
-                                    except Exception as e:
-                                        logger.warning(f"[Worker] Failed to upload to cloud storage: {str(e)}")
+                    def compress_and_upload():
+                        try:
+                            # Compress screenshot first (with watermark)
+                            success, compressed_path = self._compress_screenshot(
+                                original_screenshot_path,
+                                screenshot_time=scrape_datetime
+                            )
+                            final_path = compressed_path if success else original_screenshot_path
+
+                            # Upload to cloud storage if enabled
+                            if self.use_cloud_storage and self.cloud_storage:
+                                try:
+                                    # Generate remote path (same structure as local)
+                                    remote_path = final_path.replace(str(self.screenshot_dir), '').lstrip('/')
+                                    cloud_url = self.cloud_storage.upload_file(
+                                        final_path,
+                                        remote_path,
+                                        content_type='image/jpeg' if final_path.endswith('.jpg') else 'image/png'
+                                    )
+
+                                    if cloud_url:
+                                        # Delete local file after successful upload
+                                        try:
+                                            os.remove(final_path)
+                                        except:
+                                            pass
+                                        return cloud_url
+                                    else:
+                                        logger.warning(f"[Worker] Cloud upload succeeded but no URL returned for {city_name}")
                                         return final_path
-                                elif success and compressed_path != original_screenshot_path:
-                                    # No cloud storage, but compression happened - use compressed path
-                                    return compressed_path
-                                else:
-                                    return original_screenshot_path
-                            except Exception as e:
-                                logger.warning(f"[Worker] Error compressing/uploading screenshot for {city_name}: {str(e)}")
+                                except Exception as e:
+                                    logger.warning(f"[Worker] Failed to upload to cloud storage: {str(e)}")
+                                    return final_path
+                            elif success and compressed_path != original_screenshot_path:
+                                # No cloud storage, but compression happened - use compressed path
+                                return compressed_path
+                            else:
                                 return original_screenshot_path
-                        
-                        # Wait for compression/upload to complete (with increased timeout for large screenshots)
-                        future = executor.submit(compress_and_upload)
-                        try:
-                            screenshot_path = future.result(timeout=120)  # Increased to 120 seconds for large screenshots
-                            if self.use_cloud_storage and screenshot_path.startswith('http'):
-                                logger.debug(f"[Worker] Uploaded screenshot to R2: {screenshot_path}")
-                        except concurrent.futures.TimeoutError:
-                            logger.error(f"[Worker] Timeout compressing/uploading screenshot for {city_name} (120s exceeded)")
-                            # Keep original path if timeout - continue with scraping
-                            screenshot_path = original_screenshot_path  # Keep original path
                         except Exception as e:
-                            logger.error(f"[Worker] Error in compression/upload thread: {str(e)}")
-                            # Keep original path if error
-                            screenshot_path = original_screenshot_path
-                    
+                            logger.warning(f"[Worker] Error compressing/uploading screenshot for {city_name}: {str(e)}")
+                            return original_screenshot_path
+
+                    # Await the blocking work on the persistent pool: the
+                    # event loop keeps serving other workers instead of
+                    # blocking in future.result() for up to two minutes
+                    loop = asyncio.get_running_loop()
+                    try:
+                        screenshot_path = await asyncio.wait_for(
+                            loop.run_in_executor(self._io_executor, compress_and_upload),
+                            timeout=120  # generous ceiling for large screenshots
+                        )
+                        if self.use_cloud_storage and screenshot_path.startswith('http'):
+                            logger.debug(f"[Worker] Uploaded screenshot to R2: {screenshot_path}")
+                    except asyncio.TimeoutError:
+                        logger.error(f"[Worker] Timeout compressing/uploading screenshot for {city_name} (120s exceeded)")
+                        # Keep original path if timeout - continue with scraping
+                        screenshot_path = original_screenshot_path  # Keep original path
+                    except Exception as e:
+                        logger.error(f"[Worker] Error in compression/upload thread: {str(e)}")
+                        # Keep original path if error
+                        screenshot_path = original_screenshot_path
+
                     logger.debug(f"[Worker] Captured results page screenshot for {city_name} ({pickup_date.date()} to {return_date.date()})")
                 except Exception as e:
                     logger.error(f"[Worker] Error capturing screenshot for {city_name}: {str(e)}")
                     screenshot_path = None
             
-            # Save vehicles to database (thread-safe) - all share the same screenshot path
+            # Build all rows for this combination, then save them in one
+            # batched insert - one round-trip for the whole combination
+            # instead of one per vehicle
+            batch = []
             for vehicle in vehicles:
                 try:
                     # Extract depot_code and supplier_code directly from vehicle data
                     depot_code = self._extract_depot_code_from_url(vehicle.get('detail_url', ''))
                     supplier_code = self._extract_supplier_code_from_logo(vehicle.get('logo_url', ''))
-                    
+
                     vehicle_data = {
                         'scrape_datetime': scrape_datetime,
                         'city': city_name,
-                        'pickup_date': pickup_date.isoformat(),
-                        'return_date': return_date.isoformat(),
+                        # Real datetime objects: psycopg2 adapts them
+                        # natively, so no ISO round-trip through strings
+                        'pickup_date': pickup_date,
+                        'return_date': return_date,
                         'vehicle_name': vehicle.get('vehicle_name'),
                         'vehicle_type': vehicle.get('vehicle_type'),
                         'seats': vehicle.get('seats'),
@@ -1679,16 +1964,20 @@ class DriveNowScraper:
                         'city_latitude': city.get('latitude'),
                         'city_longitude': city.get('longitude'),
                     }
-                    
-                    with self.db_lock:
-                        vehicle_id = db.insert_vehicle(vehicle_data)
-                        vehicle_data['id'] = vehicle_id
-                    
-                    vehicles_collected.append(vehicle_data)
+                    batch.append(vehicle_data)
                 except Exception as e:
-                    logger.error(f"[Worker] Error saving vehicle for {city_name}: {str(e)}")
+                    logger.error(f"[Worker] Error building vehicle row for {city_name}: {str(e)}")
                     continue
-            
+
+            if batch:
+                try:
+                    inserted_ids = await self._db_write(db.insert_vehicles_bulk, batch)
+                    for vehicle_data, vehicle_id in zip(batch, inserted_ids):
+                        vehicle_data['id'] = vehicle_id
+                    vehicles_collected.extend(batch)
+                except Exception as e:
+                    logger.error(f"[Worker] Error saving {len(batch)} vehicles for {city_name}: {str(e)}")
+
             return vehicles_collected
             
         except Exception as e:
@@ -1700,30 +1989,7 @@ class DriveNowScraper:
     
     def _build_results_url_async(self, city: Dict, pickup_date: datetime, return_date: datetime) -> str:
         """Build the results URL (same as sync version but for async context)."""
-        from urllib.parse import quote
-        
-        pickup_date_str = self._format_date_for_url(pickup_date)
-        pickup_time_str = self._format_time_for_url(pickup_date)
-        return_date_str = self._format_date_for_url(return_date)
-        return_time_str = self._format_time_for_url(return_date)
-        
-        lat = city['latitude']
-        lng = city['longitude']
-        location = city['location_string']
-        radius = city.get('radius', 3)
-        
-        location_encoded = quote(location, safe=',')
-        
-        url = (
-            f"{self.results_base_url}/"
-            f"{pickup_date_str}/{pickup_time_str}/"
-            f"{return_date_str}/{return_time_str}/"
-            f"{lat},{lng},2/{lat},{lng},2/"
-            f"{location_encoded}/{location_encoded}/"
-            f"AU/30?radius={radius}&pickupCountry=AU&returnCountry=AU&bookingEngine=ube&affiliateCode=drivenow"
-        )
-        
-        return url
+        return self._build_results_url(city, pickup_date, return_date)
     
     async def _fetch_depots_async(self, page: AsyncPage, city: Dict, pickup_date: datetime, return_date: datetime) -> Dict[str, Dict]:
         """
@@ -1934,7 +2200,6 @@ class DriveNowScraper:
         Returns:
             Dictionary with parsed vehicle details
         """
-        import re
         
         details = {
             'vehicle_model': None,
@@ -2141,11 +2406,77 @@ class DriveNowScraper:
                     details['logo_url'] = logo_src
         except:
             pass
-        
+
         return details
-    
-    
-    
+
+    def _extract_vehicle_details_from_soup(self, card) -> Dict[str, any]:
+        """
+        Extract the same fields as the element-handle version, but from a
+        BeautifulSoup card - no CDP round-trips, just in-process parsing.
+        """
+        def text_of(selector):
+            node = card.select_one(selector)
+            text = node.get_text(strip=True) if node else None
+            return text or None
+
+        details = {
+            'vehicle_name': text_of(".fuel-type-tag--container"),
+            'fuel_type': text_of(".fuel-type-tag"),
+            'vehicle_type': text_of(".vehicle-type"),
+            'seats': None,
+            'doors': None,
+            'transmission': None,
+            'excess': None,
+            'price_per_day': text_of(".perdayprice"),
+            'total_price': text_of(".total-price-number"),
+            'logo_url': None,
+        }
+
+        # Feature items are positional: seats, doors, (skip), transmission, excess
+        feature_items = card.select(".feature-item")
+        for key, pos in (('seats', 0), ('doors', 1), ('transmission', 3), ('excess', 4)):
+            if len(feature_items) > pos:
+                text = feature_items[pos].get_text(strip=True)
+                if text:
+                    details[key] = text
+
+        logo = card.select_one(".img-responsive")
+        if logo and logo.get('src'):
+            details['logo_url'] = logo['src']
+
+        return details
+
+    def _extract_listings_from_html(self, html: str, base_url: str) -> List[Dict]:
+        """
+        Parse all vehicle cards from one HTML snapshot of the results page.
+
+        Returns the same vehicle dicts the element walk produces, or an
+        empty list when no cards parse - callers then fall back to the
+        per-element CDP extraction.
+        """
+        soup = BeautifulSoup(html, 'lxml')
+        cards = soup.select(".veh-list-container")
+
+        vehicles = []
+        for idx, card in enumerate(cards):
+            # The container itself may be the anchor; otherwise take the
+            # first link inside the card
+            detail_url = card.get('href')
+            if not detail_url:
+                link = card.select_one("a[href*='detail'], a[href*='vehicle'], a[href]")
+                if link:
+                    detail_url = link.get('href')
+            if detail_url and not detail_url.startswith('http'):
+                detail_url = urljoin(base_url, detail_url)
+
+            vehicles.append({
+                'index': idx,
+                'detail_url': detail_url,
+                **self._extract_vehicle_details_from_soup(card),
+            })
+
+        return vehicles
+
     async def _get_vehicle_listings_async(self, page: AsyncPage) -> List[Dict]:
         """
         Extract vehicle listings from the results page (async version).
@@ -2371,7 +2702,20 @@ class DriveNowScraper:
                 await page.evaluate("window.scrollTo(0, 0)")
             else:
                 logger.warning("[Async] No vehicle elements found with any selector")
-            
+
+            # Single-pass parse first: one page.content() round-trip fed
+            # to lxml replaces the ~6 CDP calls per vehicle the element
+            # walk below would make
+            if vehicle_elements:
+                try:
+                    html = await page.content()
+                    parsed = self._extract_listings_from_html(html, page.url)
+                    if parsed:
+                        logger.debug(f"[Async] Parsed {len(parsed)} vehicles from one HTML snapshot")
+                        return parsed
+                except Exception as e:
+                    logger.debug(f"[Async] HTML snapshot parse failed, falling back to element walk: {str(e)}")
+
             # First, try to find ALL "See Details" buttons on the page directly
             all_detail_buttons = []
             detail_selectors = [
@@ -2407,7 +2751,6 @@ class DriveNowScraper:
                     if container_href:
                         detail_url = container_href
                         if not detail_url.startswith('http'):
-                            from urllib.parse import urljoin
                             current_url = page.url
                             detail_url = urljoin(current_url, detail_url)
                 except:
@@ -2454,7 +2797,6 @@ class DriveNowScraper:
                             if href:
                                 detail_url = href
                                 if not detail_url.startswith('http'):
-                                    from urllib.parse import urljoin
                                     current_url = page.url
                                     detail_url = urljoin(current_url, detail_url)
                             else:
@@ -2465,7 +2807,6 @@ class DriveNowScraper:
                                 if data_url:
                                     detail_url = data_url
                                     if not detail_url.startswith('http'):
-                                        from urllib.parse import urljoin
                                         current_url = page.url
                                         detail_url = urljoin(current_url, detail_url)
                         except:
@@ -2549,7 +2890,6 @@ class DriveNowScraper:
                                 if href:
                                     detail_url = href
                                     if not detail_url.startswith('http'):
-                                        from urllib.parse import urljoin
                                         current_url = page.url
                                         detail_url = urljoin(current_url, detail_url)
                             except:
@@ -2647,15 +2987,13 @@ class DriveNowScraper:
                                 if href:
                                     detail_url = href
                                     if not detail_url.startswith('http'):
-                                        from urllib.parse import urljoin
                                         current_url = page.url
                                         detail_url = urljoin(current_url, detail_url)
                                 else:
                                     # Try onclick handler
                                     onclick = await see_details_button.get_attribute('onclick')
                                     if onclick:
-                                        import re
-                                        match = re.search(r'["\']([^"\']+)["\']', onclick)
+                                        match = _QUOTED_RE.search(onclick)
                                         if match:
                                             detail_url = match.group(1)
                                     
@@ -2667,7 +3005,6 @@ class DriveNowScraper:
                                         if data_url:
                                             detail_url = data_url
                                             if not detail_url.startswith('http'):
-                                                from urllib.parse import urljoin
                                                 current_url = page.url
                                                 detail_url = urljoin(current_url, detail_url)
                             except:
@@ -2717,7 +3054,6 @@ class DriveNowScraper:
                                 if href:
                                     detail_url = href
                                     if not detail_url.startswith('http'):
-                                        from urllib.parse import urljoin
                                         current_url = page.url
                                         detail_url = urljoin(current_url, detail_url)
                             except:
@@ -2819,67 +3155,72 @@ class DriveNowScraper:
                 city_vehicles_by_duration = {}
                 city_total_vehicles = 0
                 
-                # Process all dates for this city in parallel (using workers = number of return_days)
-                # Split city combinations into batches if needed (shouldn't be needed since workers = return_days count)
-                for batch_start in range(0, len(city_combinations), self.workers):
-                    batch_end = min(batch_start + self.workers, len(city_combinations))
-                    batch = city_combinations[batch_start:batch_end]
-                    
-                    # Create tasks for all date combinations in this city batch
-                    tasks = []
-                    for combo in batch:
-                        context = self.async_contexts[combo['city']['name'].__hash__() % len(self.async_contexts)]
-                        task = self._collect_vehicle_data_worker_async(
+                # Process all dates for this city in parallel. One bounded
+                # gather over the whole city replaces the old fixed-size
+                # batches with a barrier between them: the semaphore keeps
+                # in-flight work at the context-pool size, and a slow
+                # combination no longer holds idle workers hostage at the
+                # end of its batch
+                sem = asyncio.Semaphore(len(self.async_contexts))
+
+                async def collect_bounded(idx, combo):
+                    # Stagger initial starts by a small random delay to
+                    # avoid simultaneous requests; later tasks are paced
+                    # by the semaphore, so cap the ramp at the pool size
+                    start_delay = random.uniform(0, 2.0) * min(idx, len(self.async_contexts))
+                    await asyncio.sleep(start_delay)
+                    async with sem:
+                        # Round-robin the pooled contexts by position:
+                        # hashing the city name put every combination of a
+                        # city (same city) on ONE context, serializing the
+                        # whole run behind a single browser context
+                        context = self.async_contexts[idx % len(self.async_contexts)]
+                        result = await self._collect_vehicle_data_worker_async(
                             context, combo['city'], combo['pickup_date'], combo['return_date'],
                             scrape_datetime, db
                         )
-                        tasks.append((task, combo))
-                    
-                    # Run all tasks concurrently (but with staggered start to avoid simultaneous requests)
-                    async def create_staggered_task(task, idx):
-                        # Stagger each task by a small random delay (0-2 seconds per task)
-                        start_delay = random.uniform(0, 2.0) * idx
-                        await asyncio.sleep(start_delay)
-                        return await task
-                    
-                    staggered_tasks = [create_staggered_task(task, idx) for idx, (task, combo) in enumerate(tasks)]
-                    results = await asyncio.gather(*staggered_tasks, return_exceptions=True)
-                    
-                    # Count collected vehicles
-                    for (task, combo), result in zip(tasks, results):
-                        try:
-                            if isinstance(result, Exception):
-                                logger.error(f"Error in task for {combo['city']['name']}: {str(result)}")
-                                progress.update(main_task, advance=1)
-                                continue
-                            
-                            if result:
-                                count = len(result)
-                                total_collected += count
-                                city_total_vehicles += count
-                                
-                                pickup = combo['pickup_date'].date()
-                                return_date = combo['return_date'].date()
-                                
-                                # Calculate duration in days
-                                duration_days = (return_date - pickup).days
-                                duration_key = f"+{duration_days} day{'s' if duration_days != 1 else ''}"
-                                
-                                # Track vehicles per duration
-                                if duration_key not in city_vehicles_by_duration:
-                                    city_vehicles_by_duration[duration_key] = 0
-                                city_vehicles_by_duration[duration_key] += count
-                                
-                                progress.update(main_task, advance=1, description=f"[cyan]Scraping vehicles... [green]{pickup}→{return_date}: {count} vehicles[/green]")
-                                
-                                # Add delay after each successful combination to avoid detection
-                                post_combo_delay = random.uniform(self.random_delay_min, self.random_delay_max)
-                                await asyncio.sleep(post_combo_delay)
-                            else:
-                                progress.update(main_task, advance=1)
-                        except Exception as e:
-                            logger.error(f"Error processing result: {str(e)}")
+                        # Pause before releasing the slot so each context
+                        # keeps a human-looking gap between combinations
+                        if result:
+                            await asyncio.sleep(random.uniform(self.random_delay_min, self.random_delay_max))
+                        return result
+
+                results = await asyncio.gather(
+                    *(collect_bounded(idx, combo) for idx, combo in enumerate(city_combinations)),
+                    return_exceptions=True
+                )
+
+                # Count collected vehicles
+                for combo, result in zip(city_combinations, results):
+                    try:
+                        if isinstance(result, Exception):
+                            logger.error(f"Error in task for {combo['city']['name']}: {str(result)}")
+                            progress.update(main_task, advance=1)
+                            continue
+
+                        if result:
+                            count = len(result)
+                            total_collected += count
+                            city_total_vehicles += count
+
+                            pickup = combo['pickup_date'].date()
+                            return_date = combo['return_date'].date()
+
+                            # Calculate duration in days
+                            duration_days = (return_date - pickup).days
+                            duration_key = f"+{duration_days} day{'s' if duration_days != 1 else ''}"
+
+                            # Track vehicles per duration
+                            if duration_key not in city_vehicles_by_duration:
+                                city_vehicles_by_duration[duration_key] = 0
+                            city_vehicles_by_duration[duration_key] += count
+
+                            progress.update(main_task, advance=1, description=f"[cyan]Scraping vehicles... [green]{pickup}→{return_date}: {count} vehicles[/green]")
+                        else:
                             progress.update(main_task, advance=1)
+                    except Exception as e:
+                        logger.error(f"Error processing result: {str(e)}")
+                        progress.update(main_task, advance=1)
                 
                 # Calculate city completion time
                 city_end_time = time.time()
@@ -2931,65 +3272,28 @@ class DriveNowScraper:
         console.print("[bold blue]DriveNow Scraper - Starting Collection[/bold blue]")
         console.print("[bold blue]="*60)
         
-        # Run collection in separate thread with event loop
-        def run_collection():
-            new_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(new_loop)
+        # Collection and browser teardown share one event loop on this
+        # thread; asyncio.run cancels stragglers and shuts down async
+        # generators itself, so no manual pending-task dance is needed
+        async def collect_and_close():
             try:
-                new_loop.run_until_complete(self._collect_all_vehicles_parallel_async(db))
+                await self._collect_all_vehicles_parallel_async(db)
             finally:
-                # Wait for pending tasks before closing
                 try:
-                    pending = asyncio.all_tasks(new_loop)
-                    if pending:
-                        for task in pending:
-                            task.cancel()
-                        new_loop.run_until_complete(
-                            asyncio.gather(*pending, return_exceptions=True)
-                        )
-                except Exception:
-                    pass
-                finally:
-                    new_loop.close()
-        
-        collection_thread = threading.Thread(target=run_collection, daemon=False)
-        collection_thread.start()
-        collection_thread.join()
-        
+                    await asyncio.wait_for(self._close_async(), timeout=5.0)
+                except (asyncio.TimeoutError, Exception):
+                    self.async_contexts = []
+                    self.async_browser = None
+                    self.async_playwright = None
+
+        asyncio.run(collect_and_close())
+
         # Calculate and log collection duration
         end_time = time.time()
         duration = end_time - start_time
         minutes = int(duration // 60)
         seconds = int(duration % 60)
-        
-        # Close async browser after collection
-        try:
-            if self.async_contexts or self.async_browser:
-                def close_browser():
-                    new_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(new_loop)
-                    try:
-                        new_loop.run_until_complete(self._close_async())
-                    finally:
-                        # Wait for pending tasks before closing
-                        try:
-                            pending = asyncio.all_tasks(new_loop)
-                            if pending:
-                                for task in pending:
-                                    task.cancel()
-                                new_loop.run_until_complete(
-                                    asyncio.gather(*pending, return_exceptions=True)
-                                )
-                        except Exception:
-                            pass
-                        finally:
-                            new_loop.close()
-                close_thread = threading.Thread(target=close_browser, daemon=False)
-                close_thread.start()
-                close_thread.join(timeout=5)
-        except:
-            pass
-        
+
         console.print("[bold blue]="*60)
         console.print(f"[bold green]✓ Collection complete! Total time: {minutes}m {seconds}s ({duration:.1f} seconds)[/bold green]")
         console.print("[bold blue]="*60)
@@ -3002,7 +3306,9 @@ class DriveNowScraper:
         # Close all async contexts in parallel with timeout
         if self.async_contexts:
             close_tasks = []
-            for context in self.async_contexts:
+            # Dedupe: in shared-context mode the list holds one context
+            # repeated per worker slot
+            for context in dict.fromkeys(self.async_contexts):
                 async def close_context(ctx):
                     try:
                         await asyncio.wait_for(ctx.close(), timeout=2.0)
@@ -3044,7 +3350,12 @@ class DriveNowScraper:
     def close(self):
         """Close the browser and cleanup (fast, with timeouts)."""
         console.print("[dim]Closing browsers and cleaning up...[/dim]")
-        
+
+        # Stop the worker threads; pending calls were awaited by their
+        # workers, so nothing is queued by the time close() runs
+        self._db_executor.shutdown(wait=False)
+        self._io_executor.shutdown(wait=False)
+
         # Close all parallel worker contexts (sync) - fast, ignore errors
         for context in self.contexts:
             try:
@@ -3056,41 +3367,12 @@ class DriveNowScraper:
         # Close async browser if it exists - with short timeout
         if self.async_contexts or self.async_browser or self.async_playwright:
             try:
-                # Always create a new event loop in a thread for async cleanup
-                import concurrent.futures
-                import threading
-                
-                def run_close():
-                    new_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(new_loop)
-                    try:
-                        new_loop.run_until_complete(asyncio.wait_for(self._close_async(), timeout=5.0))
-                    except (asyncio.TimeoutError, Exception):
-                        # Force cleanup on timeout/error
-                        self.async_contexts = []
-                        self.async_browser = None
-                        self.async_playwright = None
-                    finally:
-                        # Wait for pending tasks before closing
-                        try:
-                            pending = asyncio.all_tasks(new_loop)
-                            if pending:
-                                for task in pending:
-                                    task.cancel()
-                                new_loop.run_until_complete(
-                                    asyncio.gather(*pending, return_exceptions=True)
-                                )
-                        except Exception:
-                            pass
-                        finally:
-                            new_loop.close()
-                
-                # Run in thread with timeout
-                thread = threading.Thread(target=run_close, daemon=True)
-                thread.start()
-                thread.join(timeout=6.0)  # Max 6 seconds total
-                
-            except Exception as e:
+                # asyncio.run on this thread enforces the timeout and
+                # performs task/async-generator shutdown itself - no
+                # daemon thread that could die mid-teardown and leak a
+                # zombie Chromium process
+                asyncio.run(asyncio.wait_for(self._close_async(), timeout=5.0))
+            except (asyncio.TimeoutError, Exception) as e:
                 logger.debug(f"Error closing async browser: {str(e)}")
                 # Force cleanup
                 self.async_contexts = []